@@ -1,7 +1,7 @@
 """Affiliate referral helpers."""
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AffiliateReferral
@@ -10,21 +10,16 @@ from app.models import AffiliateReferral
 async def activate_referrals_for_user(db: AsyncSession, user_id: str) -> int:
     """Mark referrals as activated when a referee completes their first run."""
     result = await db.execute(
-        select(AffiliateReferral).where(
+        update(AffiliateReferral)
+        .where(
             AffiliateReferral.referee_user_id == user_id,
             AffiliateReferral.status.in_(["signed_up", "clicked"]),
             AffiliateReferral.reward_status == "pending",
         )
+        .values(status="activated")
+        .execution_options(synchronize_session=False)
     )
-    referrals = result.scalars().all()
-    if not referrals:
-        return 0
-
-    updated = 0
-    for referral in referrals:
-        if referral.status != "activated":
-            referral.status = "activated"
-            updated += 1
+    updated = result.rowcount or 0
     if updated:
         await db.commit()
     return updated
@@ -1,13 +1,14 @@
 """Shared agent types and tool registry primitives."""
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Protocol
 
 from pydantic import BaseModel, Field
 
+from app.utils.json_utils import dumps_str
+
 
 class AgentRole(str, Enum):
     SYSTEM = "system"
@@ -46,7 +47,7 @@ class ToolResult(BaseModel):
             "error": self.error,
             "task_id": self.task_id,
         }
-        return json.dumps(payload, ensure_ascii=True)
+        return dumps_str(payload)
 
 
 class AgentMessage(BaseModel):
@@ -64,7 +65,7 @@ class ToolSpec(BaseModel):
     output_schema: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     session_id: str
     messages: List[AgentMessage] = field(default_factory=list)
@@ -73,7 +74,7 @@ class AgentState:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolContext:
     state: AgentState
     emit_event: Optional[Callable[[str, Dict[str, Any]], None]] = None
@@ -83,7 +84,7 @@ class ToolContext:
         return self.state.session_id
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTurnOutcome:
     assistant_message: AgentMessage
     tool_results: List[ToolResult]
@@ -94,19 +95,24 @@ class ToolHandler(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolRegistry:
     _tools: Dict[str, ToolSpec] = field(default_factory=dict)
     _handlers: Dict[str, ToolHandler] = field(default_factory=dict)
+    _specs_cache: Optional[List[ToolSpec]] = field(default=None, init=False, repr=False)
 
     def register(self, spec: ToolSpec, handler: ToolHandler) -> None:
         if spec.name in self._tools:
             raise ValueError(f"Tool '{spec.name}' already registered")
         self._tools[spec.name] = spec
         self._handlers[spec.name] = handler
+        self._specs_cache = None
 
     def specs(self) -> List[ToolSpec]:
-        return list(self._tools.values())
+        # Shared list rebuilt only after register(); callers must not mutate it.
+        if self._specs_cache is None:
+            self._specs_cache = list(self._tools.values())
+        return self._specs_cache
 
     async def execute(self, context: ToolContext, call: ToolCall) -> ToolResult:
         handler = self._handlers.get(call.name)
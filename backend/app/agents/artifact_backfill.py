@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
 from app.schemas.artifact_schemas import (
     create_data_table_from_claims,
@@ -18,52 +18,63 @@ def _with_artifact_id(payload: Dict[str, Any]) -> Dict[str, Any]:
     return payload
 
 
+def _from_run_capsule(output: Dict[str, Any]) -> List[Dict[str, Any]]:
+    summary = output.get("summary")
+    if not isinstance(summary, dict):
+        return []
+    storyboard = create_storyboard_from_capsule_output(
+        summary,
+        artifact_id=str(uuid.uuid4()),
+        title="Storyboard",
+    )
+    shot_list = create_shot_list_from_storyboard(
+        storyboard,
+        artifact_id=str(uuid.uuid4()),
+    )
+    return [storyboard.model_dump(mode="json"), shot_list.model_dump(mode="json")]
+
+
+def _from_analyze_sources(output: Dict[str, Any]) -> List[Dict[str, Any]]:
+    summary = output.get("summary")
+    if not isinstance(summary, dict):
+        return []
+    if isinstance(output.get("evidence_refs"), list) and "evidence_refs" not in summary:
+        summary = {**summary, "evidence_refs": output.get("evidence_refs")}
+    data_table = create_data_table_from_claims(
+        summary,
+        artifact_id=str(uuid.uuid4()),
+        title="Claim Evidence Table",
+    )
+    return [data_table.model_dump(mode="json")] if data_table else []
+
+
+def _from_generate_storyboard(output: Dict[str, Any]) -> List[Dict[str, Any]]:
+    preview = output.get("storyboard")
+    if not isinstance(preview, list):
+        return []
+    storyboard = create_storyboard_from_preview(
+        preview,
+        artifact_id=str(uuid.uuid4()),
+        title="Storyboard Preview",
+    )
+    return [storyboard.model_dump(mode="json")] if storyboard else []
+
+
+_BUILDERS: Dict[str, Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = {
+    "run_capsule": _from_run_capsule,
+    "analyze_sources": _from_analyze_sources,
+    "generate_storyboard": _from_generate_storyboard,
+}
+
+
 def derive_artifacts_from_tool_payload(
     tool_name: str,
     payload: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
     """Create standardized artifact payloads from a tool result payload."""
+    builder = _BUILDERS.get(tool_name)
+    if builder is None:
+        return []
     output = payload.get("output")
     output = output if isinstance(output, dict) else {}
-    artifacts: List[Dict[str, Any]] = []
-
-    if tool_name == "run_capsule":
-        summary = output.get("summary")
-        if isinstance(summary, dict):
-            storyboard = create_storyboard_from_capsule_output(
-                summary,
-                artifact_id=str(uuid.uuid4()),
-                title="Storyboard",
-            )
-            artifacts.append(storyboard.model_dump(mode="json"))
-            shot_list = create_shot_list_from_storyboard(
-                storyboard,
-                artifact_id=str(uuid.uuid4()),
-            )
-            artifacts.append(shot_list.model_dump(mode="json"))
-
-    if tool_name == "analyze_sources":
-        summary = output.get("summary")
-        if isinstance(summary, dict):
-            if isinstance(output.get("evidence_refs"), list) and "evidence_refs" not in summary:
-                summary = {**summary, "evidence_refs": output.get("evidence_refs")}
-            data_table = create_data_table_from_claims(
-                summary,
-                artifact_id=str(uuid.uuid4()),
-                title="Claim Evidence Table",
-            )
-            if data_table:
-                artifacts.append(data_table.model_dump(mode="json"))
-
-    if tool_name == "generate_storyboard":
-        preview = output.get("storyboard")
-        if isinstance(preview, list):
-            storyboard = create_storyboard_from_preview(
-                preview,
-                artifact_id=str(uuid.uuid4()),
-                title="Storyboard Preview",
-            )
-            if storyboard:
-                artifacts.append(storyboard.model_dump(mode="json"))
-
-    return [_with_artifact_id(payload) for payload in artifacts]
+    return [_with_artifact_id(artifact) for artifact in builder(output)]
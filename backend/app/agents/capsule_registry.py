@@ -7,9 +7,10 @@
 이 레지스트리는 프론트엔드 노드 팔레트 및 파이프라인 실행에서 사용됩니다.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class CapsuleCategory(str, Enum):
@@ -29,7 +30,7 @@ class PortType(str, Enum):
     IMAGE_PARAMS = "image_params"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PortSpec:
     """노드 입/출력 포트 스펙"""
     id: str
@@ -39,7 +40,7 @@ class PortSpec:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CapsuleSpec:
     """캡슐 노드 스펙"""
     id: str
@@ -211,7 +212,7 @@ TEACHING_REFERENCE_ANALYZE = CapsuleSpec(
 # Registry
 # =============================================================================
 
-ALL_CAPSULES: List[CapsuleSpec] = [
+ALL_CAPSULES: Tuple[CapsuleSpec, ...] = (
     # NotebookLM RAG
     NLM_NOTEBOOK_CREATE,
     NLM_SOURCES_ADD,
@@ -222,14 +223,19 @@ ALL_CAPSULES: List[CapsuleSpec] = [
     TEACHING_STORYBOARD_CREATE,
     TEACHING_IMAGE_GENERATE,
     TEACHING_REFERENCE_ANALYZE,
-]
+)
 
 CAPSULE_BY_ID: Dict[str, CapsuleSpec] = {c.id: c for c in ALL_CAPSULES}
 
-CAPSULES_BY_CATEGORY: Dict[CapsuleCategory, List[CapsuleSpec]] = {
-    CapsuleCategory.NOTEBOOKLM: [c for c in ALL_CAPSULES if c.category == CapsuleCategory.NOTEBOOKLM],
-    CapsuleCategory.TEACHING: [c for c in ALL_CAPSULES if c.category == CapsuleCategory.TEACHING],
-}
+
+def _group_by_category() -> Dict[CapsuleCategory, Tuple[CapsuleSpec, ...]]:
+    grouped: Dict[CapsuleCategory, List[CapsuleSpec]] = defaultdict(list)
+    for capsule in ALL_CAPSULES:
+        grouped[capsule.category].append(capsule)
+    return {category: tuple(capsules) for category, capsules in grouped.items()}
+
+
+CAPSULES_BY_CATEGORY: Dict[CapsuleCategory, Tuple[CapsuleSpec, ...]] = _group_by_category()
 
 
 def get_capsule(capsule_id: str) -> Optional[CapsuleSpec]:
@@ -243,14 +249,14 @@ def get_capsule_endpoint(capsule_id: str) -> Optional[str]:
     return capsule.endpoint if capsule else None
 
 
-def list_capsules(category: Optional[CapsuleCategory] = None) -> List[CapsuleSpec]:
+def list_capsules(category: Optional[CapsuleCategory] = None) -> Tuple[CapsuleSpec, ...]:
     """캡슐 목록 조회 (카테고리 필터 옵션)"""
     if category:
-        return CAPSULES_BY_CATEGORY.get(category, [])
+        return CAPSULES_BY_CATEGORY.get(category, ())
     return ALL_CAPSULES
 
 
-def to_frontend_schema() -> Dict[str, Any]:
+def _build_frontend_schema() -> Dict[str, Any]:
     """프론트엔드용 캡슐 스키마 변환"""
     return {
         "capsules": [
@@ -274,3 +280,12 @@ def to_frontend_schema() -> Dict[str, Any]:
         ],
         "categories": [cat.value for cat in CapsuleCategory],
     }
+
+
+# ALL_CAPSULES는 모듈 상수이므로 스키마는 임포트 시 한 번만 생성
+_FRONTEND_SCHEMA: Dict[str, Any] = _build_frontend_schema()
+
+
+def to_frontend_schema() -> Dict[str, Any]:
+    """프론트엔드용 캡슐 스키마 (공유 객체이므로 수정 금지)"""
+    return _FRONTEND_SCHEMA
@@ -9,7 +9,6 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
-from functools import partial
 from typing import Any, Dict, List, Tuple
 
 from app.agents.agent_types import (
@@ -28,7 +27,21 @@ from app.agents.tool_utils import (
     TokenUsageTracker,
     validation_error,
 )
+from app.capsule_adapter import execute_capsule, generate_storyboard_preview
+from app.config import settings
 from app.logging_config import get_logger
+from app.notebooklm_client import (
+    extract_logic_vector,
+    extract_persona_vector,
+    generate_claims_with_evidence,
+    generate_story_beats,
+    generate_storyboard_cards,
+    generate_variation_guide,
+)
+from app.schemas.artifact_schemas import (
+    create_data_table_from_claims,
+    create_storyboard_from_preview,
+)
 
 logger = get_logger("capsule_tools")
 
@@ -37,13 +50,32 @@ logger = get_logger("capsule_tools")
 # Analysis Step Definitions
 # =============================================================================
 
-ANALYSIS_STEPS = [
+ANALYSIS_STEPS = (
     (1, "logic_vector", 0, 20),
     (2, "persona_vector", 20, 40),
     (3, "variation_guide", 40, 60),
     (4, "claims", 60, 80),
     (5, "storyboard", 80, 100),
-]
+)
+
+
+def _step_payload(step: int, name: str, progress: int) -> Dict[str, Any]:
+    return {
+        "step": step,
+        "name": name,
+        "progress": progress,
+        "total_steps": len(ANALYSIS_STEPS),
+    }
+
+
+# Prebuilt progress payloads; EventEmitter.emit copies them before sending.
+_STEP_STARTED = {name: _step_payload(step, name, start) for step, name, start, _ in ANALYSIS_STEPS}
+_STEP_FINISHED = {name: _step_payload(step, name, end) for step, name, _, end in ANALYSIS_STEPS}
+
+
+def _emit_step(emitter: Any, name: str, *, finished: bool = False) -> None:
+    payload = (_STEP_FINISHED if finished else _STEP_STARTED)[name]
+    emitter.emit("agent.analysis_progress", payload)
 
 
 # =============================================================================
@@ -67,8 +99,6 @@ async def _run_capsule_handler(
     emitter = create_emitter(context, call)
     
     try:
-        from app.capsule_adapter import execute_capsule
-        
         emitter.emit("agent.capsule_start", {
             "tool_name": call.name,
             "capsule_id": capsule_id,
@@ -82,17 +112,13 @@ async def _run_capsule_handler(
                 "progress": progress,
             })
         
-        loop = asyncio.get_event_loop()
-        summary, evidence_refs = await loop.run_in_executor(
-            None,
-            partial(
-                execute_capsule,
-                capsule_id=capsule_id,
-                capsule_version=capsule_version,
-                inputs=inputs,
-                params=params,
-                progress_cb=_progress_cb,
-            )
+        summary, evidence_refs = await asyncio.to_thread(
+            execute_capsule,
+            capsule_id=capsule_id,
+            capsule_version=capsule_version,
+            inputs=inputs,
+            params=params,
+            progress_cb=_progress_cb,
         )
         
         emitter.emit("agent.capsule_complete", {
@@ -173,61 +199,46 @@ async def _run_analysis_pipeline(
     
     Extracted for testability and cleaner code flow.
     """
-    from app.notebooklm_client import (
-        extract_logic_vector,
-        extract_persona_vector,
-        generate_claims_with_evidence,
-        generate_story_beats,
-        generate_storyboard_cards,
-        generate_variation_guide,
-    )
-    from app.schemas.artifact_schemas import create_data_table_from_claims
-    from app.config import settings
-    
-    loop = asyncio.get_event_loop()
     tracker = TokenUsageTracker()
     
-    # Step 1: Logic Vector
-    emitter.progress(1, "logic_vector", 0)
-    logic_vector, usage = await loop.run_in_executor(
-        None, partial(extract_logic_vector, source_pack, capsule_id)
-    )
-    tracker.add(usage)
-    emitter.progress(1, "logic_vector", 20)
-    
-    # Step 2: Persona Vector
-    emitter.progress(2, "persona_vector", 20)
-    persona_vector, usage = await loop.run_in_executor(
-        None, partial(extract_persona_vector, source_pack, capsule_id)
+    # Steps 1-2: Logic Vector and Persona Vector are independent, run concurrently.
+    # Progress events still go out in step order (1 start/end, then 2 start/end).
+    _emit_step(emitter, "logic_vector")
+    (logic_vector, logic_usage), (persona_vector, persona_usage) = await asyncio.gather(
+        asyncio.to_thread(extract_logic_vector, source_pack, capsule_id),
+        asyncio.to_thread(extract_persona_vector, source_pack, capsule_id),
     )
-    tracker.add(usage)
-    emitter.progress(2, "persona_vector", 40)
+    tracker.add(logic_usage)
+    _emit_step(emitter, "logic_vector", finished=True)
+    _emit_step(emitter, "persona_vector")
+    tracker.add(persona_usage)
+    _emit_step(emitter, "persona_vector", finished=True)
     
     # Step 3: Variation Guide
-    emitter.progress(3, "variation_guide", 40)
-    guide, usage = await loop.run_in_executor(
-        None, partial(generate_variation_guide, logic_vector, persona_vector, capsule_id)
+    _emit_step(emitter, "variation_guide")
+    guide, usage = await asyncio.to_thread(
+        generate_variation_guide, logic_vector, persona_vector, capsule_id
     )
     tracker.add(usage)
-    emitter.progress(3, "variation_guide", 60)
+    _emit_step(emitter, "variation_guide", finished=True)
     
     # Step 4: Claims with Evidence
-    emitter.progress(4, "claims", 60)
-    claims, usage = await loop.run_in_executor(
-        None, partial(generate_claims_with_evidence, guide, source_pack)
+    _emit_step(emitter, "claims")
+    claims, usage = await asyncio.to_thread(
+        generate_claims_with_evidence, guide, source_pack
     )
     tracker.add(usage)
-    emitter.progress(4, "claims", 80)
+    _emit_step(emitter, "claims", finished=True)
     
     # Step 5: Story Beats & Storyboard
-    emitter.progress(5, "storyboard", 80)
-    story_beats = await loop.run_in_executor(
-        None, partial(generate_story_beats, source_pack, capsule_id, guide, claims)
+    _emit_step(emitter, "storyboard")
+    story_beats = await asyncio.to_thread(
+        generate_story_beats, source_pack, capsule_id, guide, claims
     )
-    storyboard_cards = await loop.run_in_executor(
-        None, partial(generate_storyboard_cards, source_pack, capsule_id, guide, claims, story_beats or [])
+    storyboard_cards = await asyncio.to_thread(
+        generate_storyboard_cards, source_pack, capsule_id, guide, claims, story_beats or []
     )
-    emitter.progress(5, "storyboard", 100)
+    _emit_step(emitter, "storyboard", finished=True)
     
     # Build summary
     summary = _build_analysis_summary(
@@ -254,15 +265,13 @@ def _build_analysis_summary(
     tracker: TokenUsageTracker,
 ) -> Dict[str, Any]:
     """Build the analysis summary dict."""
-    from app.config import settings
-    
     return {
         "source_id": extract_first_source_id(source_pack),
         "summary": f"NotebookLM analysis complete for {capsule_id}",
         "output_type": "report",
         "output_language": "und",
         "prompt_version": "notebooklm-gemini-v1",
-        "model_version": getattr(settings, "GEMINI_MODEL", "gemini-1.5-pro"),
+        "model_version": settings.GEMINI_MODEL,
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "source_pack_id": source_pack.get("pack_id"),
         "capsule_id": capsule_id,
@@ -293,13 +302,8 @@ async def _generate_storyboard_handler(
         return validation_error(call, "summary", "summary (from run_capsule) is required")
     
     try:
-        from app.capsule_adapter import generate_storyboard_preview
-        from app.schemas.artifact_schemas import create_storyboard_from_preview
-        
-        loop = asyncio.get_event_loop()
-        storyboard = await loop.run_in_executor(
-            None,
-            partial(generate_storyboard_preview, summary=summary, scene_count=scene_count)
+        storyboard = await asyncio.to_thread(
+            generate_storyboard_preview, summary=summary, scene_count=scene_count
         )
         
         # Create artifact for frontend
@@ -386,11 +390,15 @@ _HANDLERS = {
 }
 
 
+# Spec/handler pairs resolved once at import
+_REGISTRATIONS = tuple(
+    (spec, _HANDLERS[spec.name]) for spec in _SPECS if spec.name in _HANDLERS
+)
+
+
 def register_capsule_tools(registry: ToolRegistry) -> None:
     """Register capsule execution and analysis tools."""
-    for spec in _SPECS:
-        handler = _HANDLERS.get(spec.name)
-        if handler:
-            registry.register(spec, handler)
+    for spec, handler in _REGISTRATIONS:
+        registry.register(spec, handler)
     
-    logger.info(f"Registered {len(_SPECS)} capsule tools")
+    logger.info(f"Registered {len(_REGISTRATIONS)} capsule tools")
@@ -4,18 +4,30 @@ Director Agent - AI 총감독
 사용자의 바이브 입력을 해석하고 자동으로 워크플로우를 구성합니다.
 LangGraph Supervisor 패턴을 사용하여 전문 에이전트들을 오케스트레이션합니다.
 """
+import asyncio
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from secrets import token_hex
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
 
 from app.config import settings
 from app.logging_config import get_logger
+from app.notebooklm_client import run_notebooklm_analysis
+from app.utils.json_utils import dumps, loads
 
 logger = get_logger("director_agent")
 
+# NotebookLM 분석 결과 캐시 (capsule_id + source_pack 기준)
+NOTEBOOKLM_CACHE_TTL_SEC = 3600
+NOTEBOOKLM_CACHE_MAX_ENTRIES = 512
+
+# 커스텀 바이브 해석 결과 캐시 (정규화된 설명 + 출력 유형 기준)
+CUSTOM_VIBE_CACHE_TTL_SEC = 24 * 3600
+CUSTOM_VIBE_CACHE_MAX_ENTRIES = 1024
+
 
 # =============================================================================
 # Schemas
@@ -30,6 +42,8 @@ class OutputType(str, Enum):
 
 class VibePreset(BaseModel):
     """사전 정의된 바이브 프리셋"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     title: str
     tone: List[str]
@@ -40,6 +54,8 @@ class VibePreset(BaseModel):
 
 class VibeInput(BaseModel):
     """사용자 바이브 입력"""
+    model_config = ConfigDict(frozen=True)
+
     type: str  # 'preset' | 'custom'
     preset_id: Optional[str] = None
     custom_description: Optional[str] = None
@@ -80,6 +96,8 @@ class HandlePosition(str, Enum):
 
 class NodeHandle(BaseModel):
     """노드의 입출력 핸들 정의"""
+    model_config = ConfigDict(frozen=True)
+
     id: str                            # "in_text", "out_video"
     type: HandleType                   # 데이터 타입
     position: HandlePosition = HandlePosition.LEFT  # 핸들 위치
@@ -89,19 +107,33 @@ class NodeHandle(BaseModel):
 
 
 # 연결 호환성 규칙
-CONNECTION_RULES: Dict[HandleType, List[HandleType]] = {
-    HandleType.TEXT: [HandleType.TEXT, HandleType.ANY],
-    HandleType.IMAGE: [HandleType.IMAGE, HandleType.VIDEO, HandleType.ANY],
-    HandleType.VIDEO: [HandleType.VIDEO, HandleType.ANY],
-    HandleType.AUDIO: [HandleType.AUDIO, HandleType.VIDEO, HandleType.ANY],
-    HandleType.DNA: [HandleType.DNA, HandleType.TEXT, HandleType.ANY],
-    HandleType.METADATA: [HandleType.METADATA, HandleType.TEXT, HandleType.ANY],
-    HandleType.ANY: [t for t in HandleType],
+CONNECTION_RULES: Dict[HandleType, FrozenSet[HandleType]] = {
+    HandleType.TEXT: frozenset({HandleType.TEXT, HandleType.ANY}),
+    HandleType.IMAGE: frozenset({HandleType.IMAGE, HandleType.VIDEO, HandleType.ANY}),
+    HandleType.VIDEO: frozenset({HandleType.VIDEO, HandleType.ANY}),
+    HandleType.AUDIO: frozenset({HandleType.AUDIO, HandleType.VIDEO, HandleType.ANY}),
+    HandleType.DNA: frozenset({HandleType.DNA, HandleType.TEXT, HandleType.ANY}),
+    HandleType.METADATA: frozenset({HandleType.METADATA, HandleType.TEXT, HandleType.ANY}),
+    HandleType.ANY: frozenset(HandleType),
+}
+
+# 핸들 타입별 비트 + 소스 타입별 허용 타겟 비트마스크 (연결 검사 = 비트 AND 한 번)
+_HANDLE_BIT: Dict[HandleType, int] = {handle_type: 1 << i for i, handle_type in enumerate(HandleType)}
+CONNECTION_MASK: Dict[HandleType, int] = {
+    source: sum(_HANDLE_BIT[target] for target in targets)
+    for source, targets in CONNECTION_RULES.items()
 }
 
 
+def can_connect(source: HandleType, target: HandleType) -> bool:
+    """소스 핸들에서 타겟 핸들로 연결 가능한지 여부"""
+    return bool(CONNECTION_MASK[source] & _HANDLE_BIT[target])
+
+
 class NodeSpec(BaseModel):
     """캔버스 노드 스펙 (확장 버전)"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: str                          # UI 노드 타입 ('input', 'capsule', 'processing' 등)
     category: NodeCategory = NodeCategory.GENERATE  # 노드 역할 카테고리
@@ -110,18 +142,20 @@ class NodeSpec(BaseModel):
     position: Dict[str, float]
     
     # 핸들 정의
-    input_handles: List[NodeHandle] = Field(default_factory=list)
-    output_handles: List[NodeHandle] = Field(default_factory=list)
+    input_handles: Tuple[NodeHandle, ...] = ()
+    output_handles: Tuple[NodeHandle, ...] = ()
     
     # 실행 설정
     ai_model: Optional[str] = None     # 사용할 AI 모델
     
-    # 데이터 (하위 호환성)
-    data: Dict[str, Any] = Field(default_factory=dict)
+    # 데이터 (하위 호환성) - 내부에서 생성되는 dict이므로 재검증/복사 없이 그대로 보관
+    data: SkipValidation[Dict[str, Any]] = Field(default_factory=dict)
 
 
 class EdgeSpec(BaseModel):
     """캔버스 엣지 스펙"""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     source: str
     target: str
@@ -131,6 +165,8 @@ class EdgeSpec(BaseModel):
 
 class NarrativeDNA(BaseModel):
     """작품의 서사 DNA - 모든 생성물이 이를 준수"""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     core_theme: str
     secondary_themes: List[str] = Field(default_factory=list)
     overall_tone: str
@@ -144,6 +180,8 @@ class NarrativeDNA(BaseModel):
 
 class WorkflowPlan(BaseModel):
     """생성된 워크플로우 계획"""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     workflow_id: str
     nodes: List[NodeSpec]
     edges: List[EdgeSpec]
@@ -211,6 +249,453 @@ VIBE_PRESETS: Dict[str, VibePreset] = {
     ),
 }
 
+# 프리셋은 불변이므로 직렬화 결과를 임포트 시 한 번만 생성 (공유 객체, 수정 금지)
+_PRESET_PAYLOADS: Dict[str, Dict[str, Any]] = {
+    preset_id: preset.model_dump() for preset_id, preset in VIBE_PRESETS.items()
+}
+_PRESET_JSON: Dict[str, bytes] = {
+    preset_id: preset.model_dump_json().encode() for preset_id, preset in VIBE_PRESETS.items()
+}
+_PRESET_LIST_JSON: bytes = dumps({"presets": list(_PRESET_PAYLOADS.values())})
+
+
+def list_preset_payloads() -> List[Dict[str, Any]]:
+    """직렬화된 프리셋 목록 (호출자가 수정해도 공유 payload는 그대로인 사본)"""
+    return [
+        {key: list(value) if isinstance(value, list) else value for key, value in payload.items()}
+        for payload in _PRESET_PAYLOADS.values()
+    ]
+
+
+def get_preset_list_json() -> bytes:
+    """직렬화된 프리셋 목록 JSON ({"presets": [...]})"""
+    return _PRESET_LIST_JSON
+
+
+def get_preset_json(preset_id: str) -> Optional[bytes]:
+    """직렬화된 프리셋 JSON (없으면 None)"""
+    return _PRESET_JSON.get(preset_id)
+
+
+# 톤 → 충돌 톤 집합
+TONE_CONFLICTS: Dict[str, FrozenSet[str]] = {
+    "어둡고": frozenset({"밝은", "경쾌한"}),
+    "따뜻한": frozenset({"차가운", "냉소적인"}),
+    "유쾌한": frozenset({"우울한", "어두운"}),
+    "프리미엄": frozenset({"저가형", "싸구려"}),
+}
+_NO_CONFLICTS: FrozenSet[str] = frozenset()
+
+# 출력 유형 한글 표기 (LLM 프롬프트용)
+OUTPUT_TYPE_KR: Dict[OutputType, str] = {
+    OutputType.SHORT_DRAMA: "숏드라마",
+    OutputType.AD: "광고",
+    OutputType.ANIMATION: "애니메이션",
+    OutputType.MUSIC_VIDEO: "뮤직비디오",
+}
+
+# 거장(capsule)별 특화 파라미터
+AUTEUR_PARAMS: Dict[str, Dict[str, Any]] = {
+    "auteur.bong-joon-ho": {
+        "tension_bias": 0.8,
+        "class_critique": True,
+        "irony_level": 0.7,
+    },
+    "auteur.park-chan-wook": {
+        "symmetry_bias": 0.9,
+        "violence_stylization": 0.8,
+        "baroque_level": 0.7,
+    },
+    "auteur.shinkai": {
+        "light_diffusion": 0.9,
+        "nostalgia_level": 0.8,
+        "romanticism": 0.85,
+    },
+}
+
+# 노드 id/type → 전문 에이전트
+AGENT_MAP: Dict[str, str] = {
+    "source": "user_input",
+    "script_gen": "script_agent",
+    "storyboard": "visual_agent",
+    "character_design": "visual_agent",
+    "hook_gen": "script_agent",
+    "visual_gen": "visual_agent",
+    "cta_gen": "script_agent",
+    "beat_sync": "audio_agent",
+    "choreo_gen": "visual_agent",
+    "visual_effects": "visual_agent",
+    "keyframe_gen": "visual_agent",
+    "motion_gen": "visual_agent",
+    "composit": "visual_agent",
+    "dna_validator": "director_agent",
+    "output": "director_agent",
+}
+
+# 장르 → 감지 키워드
+GENRE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "horror": ("공포", "스릴러", "호러"),
+    "romance": ("로맨스", "멜로", "사랑"),
+    "action": ("액션", "추격", "전투"),
+    "comedy": ("코미디", "유쾌", "반전"),
+}
+
+
+# =============================================================================
+# Workflow Templates
+# =============================================================================
+# 출력 유형별 노드/엣지는 DNA 값 몇 개를 제외하면 고정이므로 임포트 시 한 번만 생성합니다.
+# 노드 data의 DNA 의존 키는 None으로 자리만 잡아두고 요청마다 복사본에 채웁니다.
+# 엣지는 frozen이므로 모든 워크플로우가 같은 인스턴스를 공유합니다.
+
+# 공통: 스토리 입력 → DNA 검증
+_SOURCE_DNA_EDGE = EdgeSpec(id="e_s1_dna", source="source_1", target="dna_validator")
+
+_DRAMA_NODE_TEMPLATES: Tuple[NodeSpec, ...] = (
+    # Layer 1: 콘텐츠 기획
+    NodeSpec(
+        id="concept_input",
+        type="input",
+        category=NodeCategory.INPUT,
+        label="💡 컨셉 입력",
+        description="드라마의 핵심 컨셉과 로그라인을 입력",
+        position={"x": 550, "y": 50},
+        input_handles=[],  # 입력 노드는 입력 핸들 없음
+        output_handles=[
+            NodeHandle(id="out_text", type=HandleType.TEXT, position=HandlePosition.RIGHT, label="텍스트"),
+        ],
+        data={"placeholder": "예: 평범한 직장인이 어느 날 우연히...", "max_length": 500},
+    ),
+    NodeSpec(
+        id="reference_upload",
+        type="input",
+        category=NodeCategory.INPUT,
+        label="📂 레퍼런스 업로드",
+        description="참고 이미지나 영상 업로드",
+        position={"x": 250, "y": 50},
+        input_handles=[],
+        output_handles=[
+            NodeHandle(id="out_image", type=HandleType.IMAGE, position=HandlePosition.RIGHT, label="이미지"),
+            NodeHandle(id="out_video", type=HandleType.VIDEO, position=HandlePosition.RIGHT, label="영상", required=False),
+        ],
+        data={"accept": ["image/*", "video/*"]},
+    ),
+    # Layer 2: AI 생성
+    NodeSpec(
+        id="script_gen",
+        type="capsule",
+        category=NodeCategory.GENERATE,
+        label="📖 대본 생성",
+        description="AI가 시놉시스를 기반으로 대본 생성",
+        position={"x": 550, "y": 200},
+        ai_model="gemini-3-flash-preview",
+        input_handles=[
+            NodeHandle(id="in_text", type=HandleType.TEXT, position=HandlePosition.LEFT, label="컨셉"),
+            NodeHandle(id="in_dna", type=HandleType.DNA, position=HandlePosition.TOP, label="DNA", required=False),
+        ],
+        output_handles=[
+            NodeHandle(id="out_script", type=HandleType.TEXT, position=HandlePosition.RIGHT, label="대본"),
+            NodeHandle(id="out_meta", type=HandleType.METADATA, position=HandlePosition.BOTTOM, label="캐릭터"),
+        ],
+        data={"tone": None, "parameters": {"temperature": 0.8, "max_tokens": 4000}},
+    ),
+    NodeSpec(
+        id="storyboard",
+        type="capsule",
+        category=NodeCategory.GENERATE,
+        label="🎨 스토리보드",
+        description="씬별 비주얼 스토리보드 생성",
+        position={"x": 250, "y": 350},
+        ai_model="imagen-3",
+        input_handles=[
+            NodeHandle(id="in_script", type=HandleType.TEXT, position=HandlePosition.LEFT, label="대본"),
+            NodeHandle(id="in_ref", type=HandleType.IMAGE, position=HandlePosition.TOP, label="레퍼런스", required=False),
+        ],
+        output_handles=[
+            NodeHandle(id="out_images", type=HandleType.IMAGE, position=HandlePosition.RIGHT, label="스토리보드"),
+        ],
+        data={"visual_style": None, "aspect_ratio": "16:9"},
+    ),
+    NodeSpec(
+        id="dialogue_gen",
+        type="capsule",
+        category=NodeCategory.REFINE,
+        label="💬 대사 다듬기",
+        description="대사를 자연스럽게 다듬기",
+        position={"x": 850, "y": 200},
+        ai_model="gemini-pro",
+        input_handles=[
+            NodeHandle(id="in_script", type=HandleType.TEXT, position=HandlePosition.LEFT, label="대본"),
+        ],
+        output_handles=[
+            NodeHandle(id="out_dialogue", type=HandleType.TEXT, position=HandlePosition.RIGHT, label="대사"),
+        ],
+        data={"tone_adherence": None},
+    ),
+    # Layer 3: 검증
+    NodeSpec(
+        id="dna_check",
+        type="processing",
+        category=NodeCategory.VALIDATE,
+        label="🧬 DNA 컴플라이언스",
+        description="서사 DNA 준수 여부 검증",
+        position={"x": 550, "y": 480},
+        input_handles=[
+            NodeHandle(id="in_text", type=HandleType.TEXT, position=HandlePosition.LEFT, label="대본/대사"),
+            NodeHandle(id="in_images", type=HandleType.IMAGE, position=HandlePosition.TOP, label="스토리보드"),
+            NodeHandle(id="in_dna", type=HandleType.DNA, position=HandlePosition.LEFT, label="DNA"),
+        ],
+        output_handles=[
+            NodeHandle(id="out_validated", type=HandleType.DNA, position=HandlePosition.RIGHT, label="검증된 DNA"),
+            NodeHandle(id="out_issues", type=HandleType.METADATA, position=HandlePosition.BOTTOM, label="이슈"),
+        ],
+        data={"narrative_dna": None, "auto_validate": True},
+    ),
+    # Layer 4: 영상 생성
+    NodeSpec(
+        id="video_gen",
+        type="capsule",
+        category=NodeCategory.GENERATE,
+        label="🎬 영상 생성",
+        description="스토리보드 기반 비디오 클립 생성",
+        position={"x": 550, "y": 630},
+        ai_model="veo-2",
+        input_handles=[
+            NodeHandle(id="in_storyboard", type=HandleType.IMAGE, position=HandlePosition.LEFT, label="스토리보드"),
+            NodeHandle(id="in_dna", type=HandleType.DNA, position=HandlePosition.TOP, label="DNA"),
+        ],
+        output_handles=[
+            NodeHandle(id="out_video", type=HandleType.VIDEO, position=HandlePosition.RIGHT, label="영상"),
+        ],
+        data={"fps": 24, "resolution": "1080p", "motion_strength": 0.6},
+    ),
+    NodeSpec(
+        id="audio_mix",
+        type="capsule",
+        category=NodeCategory.GENERATE,
+        label="🔊 오디오 믹싱",
+        description="음향 효과와 배경음악 생성",
+        position={"x": 250, "y": 730},
+        ai_model="audiocraft",
+        input_handles=[
+            NodeHandle(id="in_video", type=HandleType.VIDEO, position=HandlePosition.LEFT, label="영상"),
+            NodeHandle(id="in_dialogue", type=HandleType.TEXT, position=HandlePosition.TOP, label="대사"),
+        ],
+        output_handles=[
+            NodeHandle(id="out_audio", type=HandleType.AUDIO, position=HandlePosition.RIGHT, label="오디오"),
+        ],
+        data={"bgm_style": None, "voice_synthesis": True},
+    ),
+    # Layer 5: 편집
+    NodeSpec(
+        id="edit_compose",
+        type="processing",
+        category=NodeCategory.COMPOSE,
+        label="✂️ 편집/합성",
+        description="영상, 오디오, 자막 최종 편집",
+        position={"x": 550, "y": 830},
+        input_handles=[
+            NodeHandle(id="in_video", type=HandleType.VIDEO, position=HandlePosition.LEFT, label="영상"),
+            NodeHandle(id="in_audio", type=HandleType.AUDIO, position=HandlePosition.LEFT, label="오디오"),
+        ],
+        output_handles=[
+            NodeHandle(id="out_final", type=HandleType.VIDEO, position=HandlePosition.RIGHT, label="최종 영상"),
+        ],
+        data={"auto_cut": True, "transition_style": "smooth", "subtitle_enabled": True},
+    ),
+)
+
+_DRAMA_EDGES: Tuple[EdgeSpec, ...] = (
+    # Input to Generation
+    EdgeSpec(id="e_concept_script", source="concept_input", target="script_gen"),
+    EdgeSpec(id="e_ref_storyboard", source="reference_upload", target="storyboard"),
+    # DNA validation input
+    EdgeSpec(id="e_dna_src", source="dna_validator", target="concept_input"),
+    # Generation flow
+    EdgeSpec(id="e_script_sb", source="script_gen", target="storyboard"),
+    EdgeSpec(id="e_script_dialogue", source="script_gen", target="dialogue_gen"),
+    # To DNA check
+    EdgeSpec(id="e_sb_dna", source="storyboard", target="dna_check"),
+    EdgeSpec(id="e_dialogue_dna", source="dialogue_gen", target="dna_check"),
+    # To video generation
+    EdgeSpec(id="e_dna_video", source="dna_check", target="video_gen"),
+    EdgeSpec(id="e_video_audio", source="video_gen", target="audio_mix"),
+    # Final composition
+    EdgeSpec(id="e_video_edit", source="video_gen", target="edit_compose"),
+    EdgeSpec(id="e_audio_edit", source="audio_mix", target="edit_compose"),
+    # Output
+    EdgeSpec(id="e_edit_out", source="edit_compose", target="output_1"),
+)
+
+_AD_NODE_TEMPLATES: Tuple[NodeSpec, ...] = (
+    NodeSpec(
+        id="hook_gen",
+        type="capsule",
+        label="🎯 훅 생성",
+        position={"x": 600, "y": 100},
+        data={"capsule_type": "hook_generator"}
+    ),
+    NodeSpec(
+        id="visual_gen",
+        type="capsule",
+        label="🖼️ 비주얼 생성",
+        position={"x": 600, "y": 300},
+        data={"style": None}
+    ),
+    NodeSpec(
+        id="cta_gen",
+        type="processing",
+        label="📢 CTA 최적화",
+        position={"x": 850, "y": 200},
+        data={}
+    ),
+)
+
+_AD_EDGES: Tuple[EdgeSpec, ...] = (
+    EdgeSpec(id="e_dna_hook", source="dna_validator", target="hook_gen"),
+    EdgeSpec(id="e_dna_visual", source="dna_validator", target="visual_gen"),
+    EdgeSpec(id="e_hook_cta", source="hook_gen", target="cta_gen"),
+    EdgeSpec(id="e_visual_cta", source="visual_gen", target="cta_gen"),
+    EdgeSpec(id="e_cta_out", source="cta_gen", target="output_1"),
+)
+
+_MV_NODE_TEMPLATES: Tuple[NodeSpec, ...] = (
+    NodeSpec(
+        id="beat_sync",
+        type="processing",
+        label="🎵 비트 싱크",
+        position={"x": 600, "y": 100},
+        data={}
+    ),
+    NodeSpec(
+        id="choreo_gen",
+        type="capsule",
+        label="💃 안무 생성",
+        position={"x": 600, "y": 300},
+        data={}
+    ),
+    NodeSpec(
+        id="visual_effects",
+        type="capsule",
+        label="✨ 비주얼 이펙트",
+        position={"x": 850, "y": 200},
+        data={"style": None}
+    ),
+)
+
+_MV_EDGES: Tuple[EdgeSpec, ...] = (
+    EdgeSpec(id="e_dna_beat", source="dna_validator", target="beat_sync"),
+    EdgeSpec(id="e_dna_choreo", source="dna_validator", target="choreo_gen"),
+    EdgeSpec(id="e_beat_vfx", source="beat_sync", target="visual_effects"),
+    EdgeSpec(id="e_choreo_vfx", source="choreo_gen", target="visual_effects"),
+    EdgeSpec(id="e_vfx_out", source="visual_effects", target="output_1"),
+)
+
+_ANIMATION_NODE_TEMPLATES: Tuple[NodeSpec, ...] = (
+    NodeSpec(
+        id="keyframe_gen",
+        type="capsule",
+        label="🖼️ 키프레임 생성",
+        position={"x": 600, "y": 100},
+        data={"style": None}
+    ),
+    NodeSpec(
+        id="motion_gen",
+        type="capsule",
+        label="🎬 모션 생성",
+        position={"x": 600, "y": 300},
+        data={}
+    ),
+    NodeSpec(
+        id="composit",
+        type="processing",
+        label="🎨 합성",
+        position={"x": 850, "y": 200},
+        data={}
+    ),
+)
+
+_ANIMATION_EDGES: Tuple[EdgeSpec, ...] = (
+    EdgeSpec(id="e_dna_kf", source="dna_validator", target="keyframe_gen"),
+    EdgeSpec(id="e_dna_motion", source="dna_validator", target="motion_gen"),
+    EdgeSpec(id="e_kf_comp", source="keyframe_gen", target="composit"),
+    EdgeSpec(id="e_motion_comp", source="motion_gen", target="composit"),
+    EdgeSpec(id="e_comp_out", source="composit", target="output_1"),
+)
+
+
+def _instantiate_nodes(
+    templates: Tuple[NodeSpec, ...],
+    dna_data: Dict[str, Dict[str, Any]],
+) -> List[NodeSpec]:
+    """템플릿 노드를 복사하고 노드별 DNA 의존 data를 채웁니다.
+
+    data는 노드마다 새 dict (persona 적용 시 노드별로 수정되므로). 중첩 값은 템플릿과 공유하므로 수정 금지.
+    """
+    return [
+        template.model_copy(update={"data": {**template.data, **dna_data.get(template.id, {})}})
+        for template in templates
+    ]
+
+
+# =============================================================================
+# Caches & Lazy Clients
+# =============================================================================
+
+class _TTLCache:
+    """TTL + 최대 크기 제한 캐시 (가득 차면 가장 오래 저장된 항목부터 제거)"""
+
+    def __init__(self, ttl_sec: float, max_entries: int):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl_sec:
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def set(self, key: Any, value: Any) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            # dict 삽입 순서 = 저장 순서
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic(), value)
+
+
+# 모듈 단위 캐시: workflow_tools 등은 호출마다 DirectorAgent()를 새로 만들므로 인스턴스가 아닌 모듈에 둔다
+# preset_id → NarrativeDNA (프리셋은 고정 데이터이고 DNA는 frozen이므로 공유 가능)
+_preset_dna_cache: Dict[str, NarrativeDNA] = {}
+# (capsule_id, source_pack JSON) → (logic_vector, persona_vector)
+_notebooklm_cache = _TTLCache(NOTEBOOKLM_CACHE_TTL_SEC, NOTEBOOKLM_CACHE_MAX_ENTRIES)
+# (정규화된 설명, output_type) → NarrativeDNA
+_custom_vibe_cache = _TTLCache(CUSTOM_VIBE_CACHE_TTL_SEC, CUSTOM_VIBE_CACHE_MAX_ENTRIES)
+
+
+# 커스텀 바이브 해석용 Gemini 모델 (최초 호출 시 1회 생성)
+_custom_vibe_model = None
+
+
+def _get_custom_vibe_model():
+    """커스텀 바이브 해석용 Gemini 모델 (configure + 모델 생성은 프로세스당 1회)"""
+    global _custom_vibe_model
+    if _custom_vibe_model is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        _custom_vibe_model = genai.GenerativeModel(
+            model_name=settings.GEMINI_MODEL,
+            generation_config={
+                "response_mime_type": "application/json",
+                "temperature": 0.7,
+            },
+        )
+    return _custom_vibe_model
+
 
 # =============================================================================
 # Director Agent
@@ -225,6 +710,13 @@ class DirectorAgent:
     
     def __init__(self):
         self.presets = VIBE_PRESETS
+        # 출력 유형 → (노드 생성, 엣지 생성)
+        self._output_builders = {
+            OutputType.SHORT_DRAMA: (self._create_drama_nodes, self._create_drama_edges),
+            OutputType.AD: (self._create_ad_nodes, self._create_ad_edges),
+            OutputType.MUSIC_VIDEO: (self._create_mv_nodes, self._create_mv_edges),
+            OutputType.ANIMATION: (self._create_animation_nodes, self._create_animation_edges),
+        }
     
     async def interpret_vibe(self, vibe_input: VibeInput) -> WorkflowPlan:
         """
@@ -252,18 +744,9 @@ class DirectorAgent:
         persona_vector = None
         
         if vibe_input.capsule_id:
-            try:
-                from app.notebooklm_client import run_notebooklm_analysis
-                source_pack = self._build_source_pack_from_dna(narrative_dna, vibe_input.output_type)
-                analysis, _ = run_notebooklm_analysis(source_pack, vibe_input.capsule_id)
-                logic_vector = analysis.get("logic_vector")
-                persona_vector = analysis.get("persona_vector")
-                logger.info(
-                    "NotebookLM analysis completed",
-                    extra={"capsule_id": vibe_input.capsule_id, "has_logic": bool(logic_vector)}
-                )
-            except Exception as e:
-                logger.warning(f"NotebookLM analysis failed, using defaults: {e}")
+            logic_vector, persona_vector = await self._analyze_with_notebooklm(
+                narrative_dna, vibe_input.output_type, vibe_input.capsule_id
+            )
         
         # 3. 워크플로우 노드 생성 (Logic Vector 기반 순서 결정)
         nodes, edges = self._generate_workflow_nodes(
@@ -282,7 +765,7 @@ class DirectorAgent:
         agent_assignments = self._assign_agents(nodes)
         
         workflow = WorkflowPlan(
-            workflow_id=f"wf_{uuid4().hex[:8]}",
+            workflow_id=f"wf_{token_hex(4)}",
             nodes=nodes,
             edges=edges,
             narrative_dna=narrative_dna,
@@ -306,8 +789,11 @@ class DirectorAgent:
         return workflow
     
     def _preset_to_dna(self, preset: VibePreset, output_type: OutputType) -> NarrativeDNA:
-        """프리셋을 서사 DNA로 변환"""
-        return NarrativeDNA(
+        """프리셋을 서사 DNA로 변환 (프리셋별 1회만 생성)"""
+        cached = _preset_dna_cache.get(preset.id)
+        if cached is not None:
+            return cached
+        dna = NarrativeDNA(
             core_theme=preset.emotional_arc.split("→")[0].strip(),
             secondary_themes=[arc.strip() for arc in preset.emotional_arc.split("→")[1:]],
             overall_tone=preset.tone[0] if preset.tone else "중립",
@@ -316,6 +802,42 @@ class DirectorAgent:
             visual_style=preset.visual_style,
             reference_works=preset.reference_works,
         )
+        _preset_dna_cache[preset.id] = dna
+        return dna
+    
+    async def _analyze_with_notebooklm(
+        self,
+        dna: NarrativeDNA,
+        output_type: OutputType,
+        capsule_id: str,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """NotebookLM 분석으로 Logic/Persona Vector 추출 (실패 시 None, None)
+        
+        동기 Gemini 호출이므로 스레드에서 실행하고, 같은 capsule_id + source_pack은
+        TTL 동안 캐시된 결과를 재사용합니다.
+        """
+        try:
+            source_pack = self._build_source_pack_from_dna(dna, output_type)
+            # pack_id는 요청마다 새로 발급되므로 캐시 키에서 제외
+            cache_key = (capsule_id, dumps({k: v for k, v in source_pack.items() if k != "pack_id"}))
+            cached = _notebooklm_cache.get(cache_key)
+            if cached is not None:
+                logger.info("NotebookLM analysis cache hit", extra={"capsule_id": capsule_id})
+                return cached
+            
+            analysis, _ = await asyncio.to_thread(run_notebooklm_analysis, source_pack, capsule_id)
+            logic_vector = analysis.get("logic_vector")
+            persona_vector = analysis.get("persona_vector")
+            logger.info(
+                "NotebookLM analysis completed",
+                extra={"capsule_id": capsule_id, "has_logic": bool(logic_vector)}
+            )
+            if "error" not in analysis:
+                _notebooklm_cache.set(cache_key, (logic_vector, persona_vector))
+            return logic_vector, persona_vector
+        except Exception as e:
+            logger.warning(f"NotebookLM analysis failed, using defaults: {e}")
+            return None, None
     
     def _build_source_pack_from_dna(
         self, 
@@ -324,7 +846,7 @@ class DirectorAgent:
     ) -> Dict[str, Any]:
         """NarrativeDNA로부터 NotebookLM용 source_pack 생성"""
         return {
-            "pack_id": f"dna_{uuid4().hex[:8]}",
+            "pack_id": f"dna_{token_hex(4)}",
             "cluster_id": f"vibe_{dna.core_theme[:20].replace(' ', '_').lower()}",
             "temporal_phase": output_type.value,
             "source_ids": [f"dna_{output_type.value}"],
@@ -353,52 +875,29 @@ class DirectorAgent:
         interpretation_frame = persona_vector.get("interpretation_frame", ["aesthetics"])
         sentence_rhythm = persona_vector.get("sentence_rhythm", {})
         
-        # 거장별 특화 파라미터
-        auteur_params = {
-            "auteur.bong-joon-ho": {
-                "tension_bias": 0.8,
-                "class_critique": True,
-                "irony_level": 0.7,
-            },
-            "auteur.park-chan-wook": {
-                "symmetry_bias": 0.9,
-                "violence_stylization": 0.8,
-                "baroque_level": 0.7,
-            },
-            "auteur.shinkai": {
-                "light_diffusion": 0.9,
-                "nostalgia_level": 0.8,
-                "romanticism": 0.85,
-            },
-        }
-        
-        params = auteur_params.get(capsule_id, {})
+        # 플랜마다 별도 dict (노드 data에 들어가므로 모듈 상수를 직접 공유하지 않음)
+        params = dict(AUTEUR_PARAMS.get(capsule_id, {}))
         
+        ai_node_count = 0
         for node in nodes:
             # 모든 AI 노드에 persona 파라미터 적용
             if node.ai_model:
-                node.data["persona_tone"] = tone
-                node.data["interpretation_frame"] = interpretation_frame
-                node.data["sentence_rhythm"] = sentence_rhythm
-                node.data["auteur_params"] = params
-                node.data["capsule_id"] = capsule_id
+                node.data.update(
+                    persona_tone=tone,
+                    interpretation_frame=interpretation_frame,
+                    sentence_rhythm=sentence_rhythm,
+                    auteur_params=params,
+                    capsule_id=capsule_id,
+                )
+                ai_node_count += 1
         
-        logger.info(f"Applied persona to {len([n for n in nodes if n.ai_model])} AI nodes")
+        logger.info(f"Applied persona to {ai_node_count} AI nodes")
         return nodes
     
-    def _get_conflicting_tones(self, tones: List[str]) -> List[str]:
+    @staticmethod
+    def _get_conflicting_tones(tones: List[str]) -> List[str]:
         """톤과 충돌하는 톤 목록 반환"""
-        conflicts = {
-            "어둡고": ["밝은", "경쾌한"],
-            "따뜻한": ["차가운", "냉소적인"],
-            "유쾌한": ["우울한", "어두운"],
-            "프리미엄": ["저가형", "싸구려"],
-        }
-        result = []
-        for tone in tones:
-            if tone in conflicts:
-                result.extend(conflicts[tone])
-        return list(set(result))
+        return list(_NO_CONFLICTS.union(*(TONE_CONFLICTS.get(tone, _NO_CONFLICTS) for tone in tones)))
     
     async def _interpret_custom_vibe(
         self, 
@@ -408,8 +907,6 @@ class DirectorAgent:
         """
         자연어 설명을 Gemini API로 해석하여 서사 DNA로 변환
         """
-        import google.generativeai as genai
-        
         if not description or len(description.strip()) < 3:
             return NarrativeDNA(
                 core_theme="사용자 정의 테마",
@@ -417,16 +914,17 @@ class DirectorAgent:
                 visual_style="기본 스타일",
             )
         
+        # 공백/대소문자만 다른 같은 설명은 Gemini 호출 없이 재사용
+        cache_key = (" ".join(description.split()).casefold(), output_type)
+        cached = _custom_vibe_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Custom vibe cache hit", extra={"description": description[:50]})
+            return cached
+        
         try:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
-            model = genai.GenerativeModel(settings.GEMINI_MODEL)
+            model = _get_custom_vibe_model()
             
-            output_type_kr = {
-                OutputType.SHORT_DRAMA: "숏드라마",
-                OutputType.AD: "광고",
-                OutputType.ANIMATION: "애니메이션",
-                OutputType.MUSIC_VIDEO: "뮤직비디오",
-            }.get(output_type, "영상 콘텐츠")
+            output_type_kr = OUTPUT_TYPE_KR.get(output_type, "영상 콘텐츠")
             
             prompt = f"""당신은 영상 콘텐츠 전문 AI 감독입니다. 
 사용자의 자연어 설명을 분석하여 콘텐츠의 서사 DNA를 정의해주세요.
@@ -452,23 +950,16 @@ class DirectorAgent:
 
 JSON만 출력하세요. 다른 설명 없이 순수 JSON만."""
 
-            response = await model.generate_content_async(
-                prompt,
-                generation_config=genai.GenerationConfig(
-                    response_mime_type="application/json",
-                    temperature=0.7,
-                )
-            )
+            response = await model.generate_content_async(prompt)
             
-            import json
-            result = json.loads(response.text)
+            result = loads(response.text)
             
             logger.info(
                 "Custom vibe interpreted",
                 extra={"description": description[:50], "core_theme": result.get("core_theme")}
             )
             
-            return NarrativeDNA(
+            dna = NarrativeDNA(
                 core_theme=result.get("core_theme", "사용자 정의 테마"),
                 secondary_themes=result.get("secondary_themes", []),
                 overall_tone=result.get("overall_tone", "중립"),
@@ -478,6 +969,8 @@ JSON만 출력하세요. 다른 설명 없이 순수 JSON만."""
                 color_palette=result.get("color_palette", []),
                 reference_works=result.get("reference_works", []),
             )
+            _custom_vibe_cache.set(cache_key, dna)
+            return dna
             
         except Exception as e:
             logger.error(f"Failed to interpret custom vibe: {e}")
@@ -505,6 +998,8 @@ JSON만 출력하세요. 다른 설명 없이 순수 JSON만."""
         
         nodes: List[NodeSpec] = []
         edges: List[EdgeSpec] = []
+        # DNA 직렬화는 플랜당 1회 (DNA 검증 노드들이 같은 dict를 공유, 읽기 전용)
+        dna_dump = dna.model_dump()
         
         # 공통 시작 노드
         source_node = NodeSpec(
@@ -528,12 +1023,12 @@ JSON만 출력하세요. 다른 설명 없이 순수 JSON만."""
             label="🧬 서사 DNA 검증",
             position={"x": 350, "y": 200},
             data={
-                "narrative_dna": dna.model_dump(),
+                "narrative_dna": dna_dump,
                 "auto_validate": True,
             }
         )
         nodes.append(dna_node)
-        edges.append(EdgeSpec(id="e_s1_dna", source="source_1", target="dna_validator"))
+        edges.append(_SOURCE_DNA_EDGE)
         
         # ========== 장르 감지 및 특화 노드 추가 ==========
         genre_nodes, genre_edges = self._detect_and_create_genre_nodes(dna, output_type)
@@ -547,18 +1042,9 @@ JSON만 출력하세요. 다른 설명 없이 순수 JSON만."""
             edges.extend(auteur_edges)
         
         # 출력 유형별 기본 노드
-        if output_type == OutputType.SHORT_DRAMA:
-            nodes.extend(self._create_drama_nodes(dna))
-            edges.extend(self._create_drama_edges())
-        elif output_type == OutputType.AD:
-            nodes.extend(self._create_ad_nodes(dna))
-            edges.extend(self._create_ad_edges())
-        elif output_type == OutputType.MUSIC_VIDEO:
-            nodes.extend(self._create_mv_nodes(dna))
-            edges.extend(self._create_mv_edges())
-        else:  # ANIMATION
-            nodes.extend(self._create_animation_nodes(dna))
-            edges.extend(self._create_animation_edges())
+        create_nodes, create_edges = self._output_builders[output_type]
+        nodes.extend(create_nodes(dna, dna_dump))
+        edges.extend(create_edges())
         
         # 최종 출력 노드
         output_node = NodeSpec(
@@ -588,13 +1074,7 @@ JSON만 출력하세요. 다른 설명 없이 순수 JSON만."""
         """
         # DNA에서 장르 감지 (로깅용)
         all_text = f"{dna.core_theme} {' '.join(dna.secondary_themes)} {dna.overall_tone}".lower()
-        genre_keywords = {
-            "horror": ["공포", "스릴러", "호러"],
-            "romance": ["로맨스", "멜로", "사랑"],
-            "action": ["액션", "추격", "전투"],
-            "comedy": ["코미디", "유쾌", "반전"],
-        }
-        detected = [g for g, kws in genre_keywords.items() if any(k in all_text for k in kws)]
+        detected = [g for g, kws in GENRE_KEYWORDS.items() if any(k in all_text for k in kws)]
         
         if detected:
             logger.info(f"Detected genres: {detected} - awaiting Dual Capsule integration")
@@ -602,313 +1082,45 @@ JSON만 출력하세요. 다른 설명 없이 순수 JSON만."""
         # Mock 노드 대신 빈 리스트 반환
         return [], []
     
-    def _create_drama_nodes(self, dna: NarrativeDNA) -> List[NodeSpec]:
+    def _create_drama_nodes(self, dna: NarrativeDNA, dna_dump: Dict[str, Any]) -> List[NodeSpec]:
         """숏드라마용 노드 생성 (핸들 시스템 적용)"""
-        return [
-            # Layer 1: 콘텐츠 기획
-            NodeSpec(
-                id="concept_input",
-                type="input",
-                category=NodeCategory.INPUT,
-                label="💡 컨셉 입력",
-                description="드라마의 핵심 컨셉과 로그라인을 입력",
-                position={"x": 550, "y": 50},
-                input_handles=[],  # 입력 노드는 입력 핸들 없음
-                output_handles=[
-                    NodeHandle(id="out_text", type=HandleType.TEXT, position=HandlePosition.RIGHT, label="텍스트"),
-                ],
-                data={"placeholder": "예: 평범한 직장인이 어느 날 우연히...", "max_length": 500},
-            ),
-            NodeSpec(
-                id="reference_upload",
-                type="input",
-                category=NodeCategory.INPUT,
-                label="📂 레퍼런스 업로드",
-                description="참고 이미지나 영상 업로드",
-                position={"x": 250, "y": 50},
-                input_handles=[],
-                output_handles=[
-                    NodeHandle(id="out_image", type=HandleType.IMAGE, position=HandlePosition.RIGHT, label="이미지"),
-                    NodeHandle(id="out_video", type=HandleType.VIDEO, position=HandlePosition.RIGHT, label="영상", required=False),
-                ],
-                data={"accept": ["image/*", "video/*"]},
-            ),
-            # Layer 2: AI 생성
-            NodeSpec(
-                id="script_gen",
-                type="capsule",
-                category=NodeCategory.GENERATE,
-                label="📖 대본 생성",
-                description="AI가 시놉시스를 기반으로 대본 생성",
-                position={"x": 550, "y": 200},
-                ai_model="gemini-3-flash-preview",
-                input_handles=[
-                    NodeHandle(id="in_text", type=HandleType.TEXT, position=HandlePosition.LEFT, label="컨셉"),
-                    NodeHandle(id="in_dna", type=HandleType.DNA, position=HandlePosition.TOP, label="DNA", required=False),
-                ],
-                output_handles=[
-                    NodeHandle(id="out_script", type=HandleType.TEXT, position=HandlePosition.RIGHT, label="대본"),
-                    NodeHandle(id="out_meta", type=HandleType.METADATA, position=HandlePosition.BOTTOM, label="캐릭터"),
-                ],
-                data={"tone": dna.overall_tone, "parameters": {"temperature": 0.8, "max_tokens": 4000}},
-            ),
-            NodeSpec(
-                id="storyboard",
-                type="capsule",
-                category=NodeCategory.GENERATE,
-                label="🎨 스토리보드",
-                description="씬별 비주얼 스토리보드 생성",
-                position={"x": 250, "y": 350},
-                ai_model="imagen-3",
-                input_handles=[
-                    NodeHandle(id="in_script", type=HandleType.TEXT, position=HandlePosition.LEFT, label="대본"),
-                    NodeHandle(id="in_ref", type=HandleType.IMAGE, position=HandlePosition.TOP, label="레퍼런스", required=False),
-                ],
-                output_handles=[
-                    NodeHandle(id="out_images", type=HandleType.IMAGE, position=HandlePosition.RIGHT, label="스토리보드"),
-                ],
-                data={"visual_style": dna.visual_style, "aspect_ratio": "16:9"},
-            ),
-            NodeSpec(
-                id="dialogue_gen",
-                type="capsule",
-                category=NodeCategory.REFINE,
-                label="💬 대사 다듬기",
-                description="대사를 자연스럽게 다듬기",
-                position={"x": 850, "y": 200},
-                ai_model="gemini-pro",
-                input_handles=[
-                    NodeHandle(id="in_script", type=HandleType.TEXT, position=HandlePosition.LEFT, label="대본"),
-                ],
-                output_handles=[
-                    NodeHandle(id="out_dialogue", type=HandleType.TEXT, position=HandlePosition.RIGHT, label="대사"),
-                ],
-                data={"tone_adherence": dna.overall_tone},
-            ),
-            # Layer 3: 검증
-            NodeSpec(
-                id="dna_check",
-                type="processing",
-                category=NodeCategory.VALIDATE,
-                label="🧬 DNA 컴플라이언스",
-                description="서사 DNA 준수 여부 검증",
-                position={"x": 550, "y": 480},
-                input_handles=[
-                    NodeHandle(id="in_text", type=HandleType.TEXT, position=HandlePosition.LEFT, label="대본/대사"),
-                    NodeHandle(id="in_images", type=HandleType.IMAGE, position=HandlePosition.TOP, label="스토리보드"),
-                    NodeHandle(id="in_dna", type=HandleType.DNA, position=HandlePosition.LEFT, label="DNA"),
-                ],
-                output_handles=[
-                    NodeHandle(id="out_validated", type=HandleType.DNA, position=HandlePosition.RIGHT, label="검증된 DNA"),
-                    NodeHandle(id="out_issues", type=HandleType.METADATA, position=HandlePosition.BOTTOM, label="이슈"),
-                ],
-                data={"narrative_dna": dna.model_dump(), "auto_validate": True},
-            ),
-            # Layer 4: 영상 생성
-            NodeSpec(
-                id="video_gen",
-                type="capsule",
-                category=NodeCategory.GENERATE,
-                label="🎬 영상 생성",
-                description="스토리보드 기반 비디오 클립 생성",
-                position={"x": 550, "y": 630},
-                ai_model="veo-2",
-                input_handles=[
-                    NodeHandle(id="in_storyboard", type=HandleType.IMAGE, position=HandlePosition.LEFT, label="스토리보드"),
-                    NodeHandle(id="in_dna", type=HandleType.DNA, position=HandlePosition.TOP, label="DNA"),
-                ],
-                output_handles=[
-                    NodeHandle(id="out_video", type=HandleType.VIDEO, position=HandlePosition.RIGHT, label="영상"),
-                ],
-                data={"fps": 24, "resolution": "1080p", "motion_strength": 0.6},
-            ),
-            NodeSpec(
-                id="audio_mix",
-                type="capsule",
-                category=NodeCategory.GENERATE,
-                label="🔊 오디오 믹싱",
-                description="음향 효과와 배경음악 생성",
-                position={"x": 250, "y": 730},
-                ai_model="audiocraft",
-                input_handles=[
-                    NodeHandle(id="in_video", type=HandleType.VIDEO, position=HandlePosition.LEFT, label="영상"),
-                    NodeHandle(id="in_dialogue", type=HandleType.TEXT, position=HandlePosition.TOP, label="대사"),
-                ],
-                output_handles=[
-                    NodeHandle(id="out_audio", type=HandleType.AUDIO, position=HandlePosition.RIGHT, label="오디오"),
-                ],
-                data={"bgm_style": dna.overall_tone, "voice_synthesis": True},
-            ),
-            # Layer 5: 편집
-            NodeSpec(
-                id="edit_compose",
-                type="processing",
-                category=NodeCategory.COMPOSE,
-                label="✂️ 편집/합성",
-                description="영상, 오디오, 자막 최종 편집",
-                position={"x": 550, "y": 830},
-                input_handles=[
-                    NodeHandle(id="in_video", type=HandleType.VIDEO, position=HandlePosition.LEFT, label="영상"),
-                    NodeHandle(id="in_audio", type=HandleType.AUDIO, position=HandlePosition.LEFT, label="오디오"),
-                ],
-                output_handles=[
-                    NodeHandle(id="out_final", type=HandleType.VIDEO, position=HandlePosition.RIGHT, label="최종 영상"),
-                ],
-                data={"auto_cut": True, "transition_style": "smooth", "subtitle_enabled": True},
-            ),
-        ]
+        return _instantiate_nodes(_DRAMA_NODE_TEMPLATES, {
+            "script_gen": {"tone": dna.overall_tone},
+            "storyboard": {"visual_style": dna.visual_style},
+            "dialogue_gen": {"tone_adherence": dna.overall_tone},
+            "dna_check": {"narrative_dna": dna_dump},
+            "audio_mix": {"bgm_style": dna.overall_tone},
+        })
     
     def _create_drama_edges(self) -> List[EdgeSpec]:
-        return [
-            # Input to Generation
-            EdgeSpec(id="e_concept_script", source="concept_input", target="script_gen"),
-            EdgeSpec(id="e_ref_storyboard", source="reference_upload", target="storyboard"),
-            # DNA validation input
-            EdgeSpec(id="e_dna_src", source="dna_validator", target="concept_input"),
-            # Generation flow
-            EdgeSpec(id="e_script_sb", source="script_gen", target="storyboard"),
-            EdgeSpec(id="e_script_dialogue", source="script_gen", target="dialogue_gen"),
-            # To DNA check
-            EdgeSpec(id="e_sb_dna", source="storyboard", target="dna_check"),
-            EdgeSpec(id="e_dialogue_dna", source="dialogue_gen", target="dna_check"),
-            # To video generation
-            EdgeSpec(id="e_dna_video", source="dna_check", target="video_gen"),
-            EdgeSpec(id="e_video_audio", source="video_gen", target="audio_mix"),
-            # Final composition
-            EdgeSpec(id="e_video_edit", source="video_gen", target="edit_compose"),
-            EdgeSpec(id="e_audio_edit", source="audio_mix", target="edit_compose"),
-            # Output
-            EdgeSpec(id="e_edit_out", source="edit_compose", target="output_1"),
-        ]
+        return list(_DRAMA_EDGES)
     
-    def _create_ad_nodes(self, dna: NarrativeDNA) -> List[NodeSpec]:
+    def _create_ad_nodes(self, dna: NarrativeDNA, dna_dump: Dict[str, Any]) -> List[NodeSpec]:
         """광고용 노드 생성"""
-        return [
-            NodeSpec(
-                id="hook_gen",
-                type="capsule",
-                label="🎯 훅 생성",
-                position={"x": 600, "y": 100},
-                data={"capsule_type": "hook_generator"}
-            ),
-            NodeSpec(
-                id="visual_gen",
-                type="capsule",
-                label="🖼️ 비주얼 생성",
-                position={"x": 600, "y": 300},
-                data={"style": dna.visual_style}
-            ),
-            NodeSpec(
-                id="cta_gen",
-                type="processing",
-                label="📢 CTA 최적화",
-                position={"x": 850, "y": 200},
-                data={}
-            ),
-        ]
+        return _instantiate_nodes(_AD_NODE_TEMPLATES, {"visual_gen": {"style": dna.visual_style}})
     
     def _create_ad_edges(self) -> List[EdgeSpec]:
-        return [
-            EdgeSpec(id="e_dna_hook", source="dna_validator", target="hook_gen"),
-            EdgeSpec(id="e_dna_visual", source="dna_validator", target="visual_gen"),
-            EdgeSpec(id="e_hook_cta", source="hook_gen", target="cta_gen"),
-            EdgeSpec(id="e_visual_cta", source="visual_gen", target="cta_gen"),
-            EdgeSpec(id="e_cta_out", source="cta_gen", target="output_1"),
-        ]
+        return list(_AD_EDGES)
     
-    def _create_mv_nodes(self, dna: NarrativeDNA) -> List[NodeSpec]:
+    def _create_mv_nodes(self, dna: NarrativeDNA, dna_dump: Dict[str, Any]) -> List[NodeSpec]:
         """뮤직비디오용 노드 생성"""
-        return [
-            NodeSpec(
-                id="beat_sync",
-                type="processing",
-                label="🎵 비트 싱크",
-                position={"x": 600, "y": 100},
-                data={}
-            ),
-            NodeSpec(
-                id="choreo_gen",
-                type="capsule",
-                label="💃 안무 생성",
-                position={"x": 600, "y": 300},
-                data={}
-            ),
-            NodeSpec(
-                id="visual_effects",
-                type="capsule",
-                label="✨ 비주얼 이펙트",
-                position={"x": 850, "y": 200},
-                data={"style": dna.visual_style}
-            ),
-        ]
+        return _instantiate_nodes(_MV_NODE_TEMPLATES, {"visual_effects": {"style": dna.visual_style}})
     
     def _create_mv_edges(self) -> List[EdgeSpec]:
-        return [
-            EdgeSpec(id="e_dna_beat", source="dna_validator", target="beat_sync"),
-            EdgeSpec(id="e_dna_choreo", source="dna_validator", target="choreo_gen"),
-            EdgeSpec(id="e_beat_vfx", source="beat_sync", target="visual_effects"),
-            EdgeSpec(id="e_choreo_vfx", source="choreo_gen", target="visual_effects"),
-            EdgeSpec(id="e_vfx_out", source="visual_effects", target="output_1"),
-        ]
+        return list(_MV_EDGES)
     
-    def _create_animation_nodes(self, dna: NarrativeDNA) -> List[NodeSpec]:
+    def _create_animation_nodes(self, dna: NarrativeDNA, dna_dump: Dict[str, Any]) -> List[NodeSpec]:
         """애니메이션용 노드 생성"""
-        return [
-            NodeSpec(
-                id="keyframe_gen",
-                type="capsule",
-                label="🖼️ 키프레임 생성",
-                position={"x": 600, "y": 100},
-                data={"style": dna.visual_style}
-            ),
-            NodeSpec(
-                id="motion_gen",
-                type="capsule",
-                label="🎬 모션 생성",
-                position={"x": 600, "y": 300},
-                data={}
-            ),
-            NodeSpec(
-                id="composit",
-                type="processing",
-                label="🎨 합성",
-                position={"x": 850, "y": 200},
-                data={}
-            ),
-        ]
+        return _instantiate_nodes(_ANIMATION_NODE_TEMPLATES, {"keyframe_gen": {"style": dna.visual_style}})
     
     def _create_animation_edges(self) -> List[EdgeSpec]:
-        return [
-            EdgeSpec(id="e_dna_kf", source="dna_validator", target="keyframe_gen"),
-            EdgeSpec(id="e_dna_motion", source="dna_validator", target="motion_gen"),
-            EdgeSpec(id="e_kf_comp", source="keyframe_gen", target="composit"),
-            EdgeSpec(id="e_motion_comp", source="motion_gen", target="composit"),
-            EdgeSpec(id="e_comp_out", source="composit", target="output_1"),
-        ]
+        return list(_ANIMATION_EDGES)
     
     def _assign_agents(self, nodes: List[NodeSpec]) -> Dict[str, str]:
         """노드에 전문 에이전트 할당"""
-        agent_map = {
-            "source": "user_input",
-            "script_gen": "script_agent",
-            "storyboard": "visual_agent",
-            "character_design": "visual_agent",
-            "hook_gen": "script_agent",
-            "visual_gen": "visual_agent",
-            "cta_gen": "script_agent",
-            "beat_sync": "audio_agent",
-            "choreo_gen": "visual_agent",
-            "visual_effects": "visual_agent",
-            "keyframe_gen": "visual_agent",
-            "motion_gen": "visual_agent",
-            "composit": "visual_agent",
-            "dna_validator": "director_agent",
-            "output": "director_agent",
-        }
-        
         assignments = {}
         for node in nodes:
-            agent = agent_map.get(node.id) or agent_map.get(node.type, "director_agent")
+            agent = AGENT_MAP.get(node.id) or AGENT_MAP.get(node.type, "director_agent")
             assignments[node.id] = agent
             
         return assignments
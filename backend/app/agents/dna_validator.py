@@ -4,10 +4,15 @@ DNA Compliance Validator Agent
 서사 DNA 정의에 따라 생성된 콘텐츠의 일관성을 검증하고
 위반 사항에 대한 개선 제안을 생성합니다.
 """
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from uuid import uuid4
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
+from secrets import token_hex
 
 from pydantic import BaseModel
 
@@ -86,6 +91,59 @@ CONFLICTING_TONES = {
     "차가운": ["따뜻한", "포근한"],
 }
 
+# 톤 → 충돌 톤 키워드 (conflict_tone, keyword) 목록 - TONE_KEYWORDS에 있는 충돌 톤만
+CONFLICT_KEYWORDS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    tone: tuple(
+        (conflict, keyword)
+        for conflict in conflicts
+        for keyword in TONE_KEYWORDS.get(conflict, ())
+    )
+    for tone, conflicts in CONFLICTING_TONES.items()
+}
+
+# 이슈 심각도별 감점
+SEVERITY_WEIGHTS = {
+    "high": 0.3,
+    "medium": 0.1,
+    "low": 0.05,
+}
+
+COMPLIANCE_CACHE_MAX_ENTRIES = 1024  # 편집 세션에서 반복 검사되는 노드 콘텐츠용
+
+
+def _content_digest(content: str) -> bytes:
+    """캐시 키용 콘텐츠 다이제스트 (대본 전체를 키로 들고 있지 않도록)"""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def _dna_fingerprint(dna: NarrativeDNA) -> Tuple:
+    """준수 검사가 읽는 DNA 필드만 모은 캐시 키 (frozen 모델이라도 톤 리스트는 변경 가능하므로 매번 계산)"""
+    return (
+        tuple(dna.allowed_tones),
+        tuple(dna.forbidden_tones),
+        dna.overall_tone,
+        dna.visual_style,
+    )
+
+
+@lru_cache(maxsize=256)
+def _style_keywords(visual_style: str) -> Tuple[str, ...]:
+    """visual_style 문자열 → 소문자 스타일 키워드 (DNA마다 반복되는 분해를 캐시)"""
+    keywords = (k.strip() for k in visual_style.lower().split(","))
+    return tuple(k for k in keywords if k)
+
+
+class _KeywordHits(dict):
+    """키워드 → content 포함 여부. 검사 1회 동안 키워드마다 한 번만 스캔합니다."""
+
+    def __init__(self, content: str):
+        super().__init__()
+        self.content = content
+
+    def __missing__(self, keyword: str) -> bool:
+        hit = self[keyword] = keyword in self.content
+        return hit
+
 
 # =============================================================================
 # DNA Validator Agent
@@ -98,6 +156,10 @@ class DNAValidator:
     생성된 콘텐츠가 정의된 서사 DNA와 일치하는지 검사합니다.
     """
     
+    def __init__(self):
+        # (content 다이제스트, content_type, DNA 지문) → 검사 결과 (LRU)
+        self._compliance_cache: "OrderedDict[Tuple[bytes, str, Tuple], ComplianceResult]" = OrderedDict()
+    
     async def check_compliance(
         self,
         content: str,
@@ -107,7 +169,43 @@ class DNAValidator:
     ) -> ComplianceResult:
         """
         콘텐츠의 DNA 준수 여부를 검사합니다.
+        
+        키워드 스캔은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        같은 콘텐츠/DNA 조합은 캐시된 결과를 새 content_id와 이슈 ID로 복제해 반환합니다.
         """
+        cache_key = (_content_digest(content), content_type, _dna_fingerprint(dna))
+        cached = self._compliance_cache.get(cache_key)
+        if cached is not None:
+            self._compliance_cache.move_to_end(cache_key)
+            return cached.model_copy(
+                update={
+                    "content_id": node_id or f"content_{token_hex(4)}",
+                    "timestamp": time.time(),
+                    "issues": [
+                        issue.model_copy(update={"id": f"issue_{token_hex(4)}"})
+                        for issue in cached.issues
+                    ],
+                    "checked_fields": list(cached.checked_fields),
+                },
+            )
+        
+        result = await asyncio.to_thread(
+            self._check_compliance_sync, content, content_type, dna, node_id
+        )
+        
+        # 캐시는 이벤트 루프 스레드에서만 갱신 (스레드 간 경합 없음)
+        self._compliance_cache[cache_key] = result.model_copy(deep=True)
+        if len(self._compliance_cache) > COMPLIANCE_CACHE_MAX_ENTRIES:
+            self._compliance_cache.popitem(last=False)
+        return result
+    
+    def _check_compliance_sync(
+        self,
+        content: str,
+        content_type: str,
+        dna: NarrativeDNA,
+        node_id: Optional[str],
+    ) -> ComplianceResult:
         logger.info(
             "Checking DNA compliance",
             extra={"content_type": content_type, "content_length": len(content)}
@@ -115,16 +213,18 @@ class DNAValidator:
         
         issues: List[ComplianceIssue] = []
         checked_fields: List[str] = []
+        # 톤/금지 톤 검사가 같은 키워드를 다시 스캔하지 않도록 공유
+        hits = _KeywordHits(content)
         
         # 1. 톤 검사
-        tone_issues = self._check_tone(content, dna)
+        tone_issues = self._check_tone(hits, dna)
         issues.extend(tone_issues)
         checked_fields.append("overall_tone")
         checked_fields.append("allowed_tones")
         checked_fields.append("forbidden_tones")
         
         # 2. 금지 톤 검사
-        forbidden_issues = self._check_forbidden(content, dna)
+        forbidden_issues = self._check_forbidden(hits, dna)
         issues.extend(forbidden_issues)
         
         # 3. 시각 스타일 검사 (설명/비주얼 콘텐츠의 경우)
@@ -136,10 +236,9 @@ class DNAValidator:
         # 4. 준수 점수 계산
         compliance_score = self._calculate_score(issues)
         
-        import time
         result = ComplianceResult(
-            content_id=node_id or f"content_{uuid4().hex[:8]}",
-            is_compliant=len([i for i in issues if i.severity == "high"]) == 0,
+            content_id=node_id or f"content_{token_hex(4)}",
+            is_compliant=not any(i.severity == "high" for i in issues),
             compliance_score=compliance_score,
             issues=issues,
             checked_fields=checked_fields,
@@ -157,49 +256,37 @@ class DNAValidator:
         
         return result
     
-    def _check_tone(self, content: str, dna: NarrativeDNA) -> List[ComplianceIssue]:
+    def _check_tone(self, hits: _KeywordHits, dna: NarrativeDNA) -> List[ComplianceIssue]:
         """톤 일치 여부 검사"""
         issues = []
         
-        # 허용된 톤의 키워드가 있는지 확인
-        allowed_tone_found = False
-        for tone in dna.allowed_tones:
-            if tone in TONE_KEYWORDS:
-                for keyword in TONE_KEYWORDS[tone]:
-                    if keyword in content:
-                        allowed_tone_found = True
-                        break
-        
         # 충돌하는 톤이 있는지 확인
         for tone in dna.allowed_tones:
-            if tone in CONFLICTING_TONES:
-                for conflict in CONFLICTING_TONES[tone]:
-                    if conflict in TONE_KEYWORDS:
-                        for keyword in TONE_KEYWORDS.get(conflict, []):
-                            if keyword in content:
-                                issues.append(ComplianceIssue(
-                                    id=f"issue_{uuid4().hex[:8]}",
-                                    type=ViolationType.TONE_MISMATCH,
-                                    severity="medium",
-                                    field="overall_tone",
-                                    expected=dna.overall_tone,
-                                    actual=f"'{keyword}' 발견",
-                                    message=f"설정된 톤 '{tone}'과 충돌하는 표현 '{keyword}'이 발견되었습니다.",
-                                    suggestion=f"'{keyword}'를 '{dna.overall_tone}'에 맞는 표현으로 수정하세요.",
-                                ))
+            for conflict, keyword in CONFLICT_KEYWORDS.get(tone, ()):
+                if hits[keyword]:
+                    issues.append(ComplianceIssue(
+                        id=f"issue_{token_hex(4)}",
+                        type=ViolationType.TONE_MISMATCH,
+                        severity="medium",
+                        field="overall_tone",
+                        expected=dna.overall_tone,
+                        actual=f"'{keyword}' 발견",
+                        message=f"설정된 톤 '{tone}'과 충돌하는 표현 '{keyword}'이 발견되었습니다.",
+                        suggestion=f"'{keyword}'를 '{dna.overall_tone}'에 맞는 표현으로 수정하세요.",
+                    ))
         
         return issues
     
-    def _check_forbidden(self, content: str, dna: NarrativeDNA) -> List[ComplianceIssue]:
+    def _check_forbidden(self, hits: _KeywordHits, dna: NarrativeDNA) -> List[ComplianceIssue]:
         """금지된 톤 사용 검사"""
         issues = []
         
         for forbidden in dna.forbidden_tones:
             if forbidden in TONE_KEYWORDS:
                 for keyword in TONE_KEYWORDS[forbidden]:
-                    if keyword in content:
+                    if hits[keyword]:
                         issues.append(ComplianceIssue(
-                            id=f"issue_{uuid4().hex[:8]}",
+                            id=f"issue_{token_hex(4)}",
                             type=ViolationType.FORBIDDEN_ELEMENT,
                             severity="high",
                             field="forbidden_tones",
@@ -216,15 +303,15 @@ class DNAValidator:
         issues = []
         
         # 시각 스타일 키워드 추출
-        style_keywords = dna.visual_style.lower().split(",")
-        style_keywords = [k.strip() for k in style_keywords if k.strip()]
+        style_keywords = _style_keywords(dna.visual_style)
         
-        # 콘텐츠에 스타일 관련 언급이 있는지 확인
-        mentioned_count = sum(1 for kw in style_keywords if kw in content.lower())
+        # 콘텐츠에 스타일 관련 언급이 있는지 확인 (소문자 변환은 한 번만)
+        content_lower = content.lower() if style_keywords else ""
+        mentioned = any(kw in content_lower for kw in style_keywords)
         
-        if mentioned_count == 0 and len(content) > 50:
+        if not mentioned and len(content) > 50:
             issues.append(ComplianceIssue(
-                id=f"issue_{uuid4().hex[:8]}",
+                id=f"issue_{token_hex(4)}",
                 type=ViolationType.VISUAL_STYLE_CONFLICT,
                 severity="low",
                 field="visual_style",
@@ -241,13 +328,7 @@ class DNAValidator:
         if not issues:
             return 1.0
         
-        severity_weights = {
-            "high": 0.3,
-            "medium": 0.1,
-            "low": 0.05,
-        }
-        
-        total_penalty = sum(severity_weights.get(i.severity, 0.05) for i in issues)
+        total_penalty = sum(SEVERITY_WEIGHTS.get(i.severity, 0.05) for i in issues)
         score = max(0.0, 1.0 - total_penalty)
         
         return round(score, 2)
@@ -263,7 +344,7 @@ class DNAValidator:
         
         for issue in compliance_result.issues:
             suggestion = {
-                "id": f"sug_{uuid4().hex[:8]}",
+                "id": f"sug_{token_hex(4)}",
                 "type": "dna_violation",
                 "title": f"{issue.type.value} 감지",
                 "message": issue.message,
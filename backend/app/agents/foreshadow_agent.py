@@ -4,10 +4,14 @@ Foreshadow Agent - 복선 회수 분석기
 장편 콘텐츠에서 설정된 복선과 회수 여부를 추적하고,
 미회수 복선에 대한 활용 제안을 생성합니다.
 """
+import asyncio
+import re
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+from itertools import accumulate
+from secrets import token_hex
 from typing import List, Optional, Dict, Any, Tuple
-from uuid import uuid4
-import re
 
 from pydantic import BaseModel
 
@@ -49,6 +53,24 @@ class ForeshadowAnalysis(BaseModel):
     analysis_score: float  # 0-1
 
 
+@dataclass
+class _PayoffBatch:
+    """탐지된 회수 후보 (병렬 리스트). Payoff 모델은 매칭된 후보만 생성합니다."""
+    locations: List[str]
+    texts: List[str]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def to_payoff(self, i: int, seed_id: str, resolution_quality: str) -> Payoff:
+        return Payoff(
+            seed_id=seed_id,
+            resolved_at=self.locations[i],
+            resolved_text=self.texts[i],
+            resolution_quality=resolution_quality,
+        )
+
+
 # =============================================================================
 # Pattern Detection
 # =============================================================================
@@ -79,6 +101,32 @@ PAYOFF_PATTERNS = [
     (r"(그때 그|그 (낡은|오래된))", "object_return"),
 ]
 
+MAX_SEEDS = 20  # 분석에 사용하는 복선 수 상한 (패턴 순서 기준 앞에서부터)
+
+# 탐지 루프용 컴파일 패턴 (패턴별 개별 스캔 - 하나의 alternation보다 re의 리터럴 접두 탐색이 빠름)
+_SEED_REGEXES: Tuple[Tuple[re.Pattern, str], ...] = tuple(
+    (re.compile(pattern), seed_type) for pattern, seed_type in FORESHADOW_PATTERNS
+)
+_PAYOFF_REGEXES: Tuple[Tuple[re.Pattern, str], ...] = tuple(
+    (re.compile(pattern), payoff_type) for pattern, payoff_type in PAYOFF_PATTERNS
+)
+_KEYWORD_RE = re.compile(r"\w{2,}")  # 복선-회수 매칭용 키워드 (2자 이상 단어)
+
+
+def _matches_ascii(pattern: str) -> bool:
+    """패턴의 선두 키워드 그룹에 ASCII 대안이 있으면 True (모두 한글이면 ASCII 텍스트에서 매치 불가)"""
+    alternatives = pattern[1:pattern.index(")")].split("|")
+    return any(alternative.isascii() for alternative in alternatives)
+
+
+# ASCII 전용 텍스트(영문 스크립트)에서는 한글 키워드 패턴을 건너뛴다
+_ASCII_SEED_REGEXES = tuple(
+    entry for entry, (pattern, _) in zip(_SEED_REGEXES, FORESHADOW_PATTERNS) if _matches_ascii(pattern)
+)
+_ASCII_PAYOFF_REGEXES = tuple(
+    entry for entry, (pattern, _) in zip(_PAYOFF_REGEXES, PAYOFF_PATTERNS) if _matches_ascii(pattern)
+)
+
 
 # =============================================================================
 # Foreshadow Agent
@@ -102,7 +150,16 @@ class ForeshadowAgent:
         Args:
             full_script: 전체 시나리오 텍스트
             segments: 선택적 세그먼트 정보 [{"label": "1막", "content": "..."}]
+        
+        패턴 스캔은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
         """
+        return await asyncio.to_thread(self._analyze_narrative_sync, full_script, segments)
+    
+    def _analyze_narrative_sync(
+        self,
+        full_script: str,
+        segments: Optional[List[Dict[str, str]]],
+    ) -> ForeshadowAnalysis:
         logger.info(
             "Analyzing narrative for foreshadowing",
             extra={"script_length": len(full_script)}
@@ -150,68 +207,76 @@ class ForeshadowAgent:
     ) -> List[NarrativeSeed]:
         """복선 패턴을 탐지합니다."""
         seeds = []
+        segment_index = self._build_segment_index(segments)
         
-        for pattern, seed_type in FORESHADOW_PATTERNS:
-            for match in re.finditer(pattern, text):
+        regexes = _ASCII_SEED_REGEXES if text.isascii() else _SEED_REGEXES
+        for regex, seed_type in regexes:
+            for match in regex.finditer(text):
                 # 문맥 추출 (매치 전후 50자)
                 start = max(0, match.start() - 50)
                 end = min(len(text), match.end() + 50)
                 context = text[start:end]
                 
                 # 세그먼트 위치 찾기
-                location = self._find_segment(match.start(), text, segments)
+                location = self._find_segment(match.start(), text, segment_index)
                 
                 seed = NarrativeSeed(
-                    id=f"seed_{uuid4().hex[:8]}",
+                    id=f"seed_{token_hex(4)}",
                     description=f"{seed_type}: {match.group()}",
                     planted_at=location,
                     planted_text=context,
                     importance="minor" if seed_type == "motif" else "major",
                 )
                 seeds.append(seed)
+                # 상위 MAX_SEEDS개만 사용하므로 이후 매치는 만들지 않음
+                if len(seeds) >= MAX_SEEDS:
+                    return seeds
         
-        return seeds[:20]  # 상위 20개로 제한
+        return seeds
     
     def _detect_payoffs(
         self,
         text: str,
         segments: Optional[List[Dict[str, str]]] = None,
-    ) -> List[Payoff]:
+    ) -> _PayoffBatch:
         """회수 패턴을 탐지합니다."""
-        payoffs = []
+        locations = []
+        texts = []
+        segment_index = self._build_segment_index(segments)
         
-        for pattern, payoff_type in PAYOFF_PATTERNS:
-            for match in re.finditer(pattern, text):
+        regexes = _ASCII_PAYOFF_REGEXES if text.isascii() else _PAYOFF_REGEXES
+        for regex, payoff_type in regexes:
+            for match in regex.finditer(text):
                 start = max(0, match.start() - 50)
                 end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                
-                location = self._find_segment(match.start(), text, segments)
-                
-                payoff = Payoff(
-                    seed_id="",  # 매칭 시 설정
-                    resolved_at=location,
-                    resolved_text=context,
-                    resolution_quality="partial",
-                )
-                payoffs.append(payoff)
+                texts.append(text[start:end])
+                locations.append(self._find_segment(match.start(), text, segment_index))
         
-        return payoffs
+        return _PayoffBatch(locations=locations, texts=texts)
+    
+    def _build_segment_index(
+        self,
+        segments: Optional[List[Dict[str, str]]],
+    ) -> Optional[Tuple[List[int], List[str]]]:
+        """세그먼트별 누적 끝 위치와 라벨 (위치 조회를 bisect로 처리하기 위함)"""
+        if not segments:
+            return None
+        ends = list(accumulate(len(seg.get("content", "")) for seg in segments))
+        labels = [seg.get("label", f"세그먼트 {i+1}") for i, seg in enumerate(segments)]
+        return ends, labels
     
     def _find_segment(
         self,
         position: int,
         text: str,
-        segments: Optional[List[Dict[str, str]]],
+        segment_index: Optional[Tuple[List[int], List[str]]],
     ) -> str:
         """텍스트 위치에 해당하는 세그먼트를 찾습니다."""
-        if segments:
-            current_pos = 0
-            for i, seg in enumerate(segments):
-                seg_len = len(seg.get("content", ""))
-                if current_pos + seg_len > position:
-                    return seg.get("label", f"세그먼트 {i+1}")
-                current_pos += seg_len
+        if segment_index:
+            ends, labels = segment_index
+            i = bisect_right(ends, position)
+            if i < len(ends):
+                return labels[i]
         
         # 세그먼트 없으면 대략적인 위치 (1/3 기준)
         relative_pos = position / len(text) if text else 0
@@ -225,7 +290,7 @@ class ForeshadowAgent:
     def _analyze_matches(
         self,
         seeds: List[NarrativeSeed],
-        payoffs: List[Payoff],
+        payoffs: _PayoffBatch,
         text: str,
     ) -> Tuple[List[Tuple[NarrativeSeed, Payoff]], List[NarrativeSeed], List[Dict]]:
         """복선과 회수를 매칭합니다."""
@@ -234,36 +299,40 @@ class ForeshadowAgent:
         weak = []
         
         used_payoffs = set()
+        # 회수 키워드 역색인(키워드 → 회수 인덱스): 씨앗과 키워드를 공유하는 회수만 겹침을 센다
+        payoff_index: Dict[str, List[int]] = defaultdict(list)
+        for i, payoff_text in enumerate(payoffs.texts):
+            for keyword in set(_KEYWORD_RE.findall(payoff_text)):
+                payoff_index[keyword].append(i)
         
         for seed in seeds:
             # 씨앗의 키워드 추출
-            seed_keywords = set(re.findall(r'\w{2,}', seed.planted_text))
+            seed_keywords = set(_KEYWORD_RE.findall(seed.planted_text))
+            
+            overlaps = Counter()
+            for keyword in seed_keywords:
+                overlaps.update(payoff_index.get(keyword, ()))
             
             best_payoff = None
             best_overlap = 0
             
-            for i, payoff in enumerate(payoffs):
+            # 겹침이 같으면 앞선 회수를 우선
+            for i, overlap in overlaps.items():
                 if i in used_payoffs:
                     continue
-                    
-                payoff_keywords = set(re.findall(r'\w{2,}', payoff.resolved_text))
-                overlap = len(seed_keywords & payoff_keywords)
-                
-                if overlap > best_overlap:
+                if overlap > best_overlap or (overlap == best_overlap and i < best_payoff):
                     best_overlap = overlap
-                    best_payoff = (i, payoff)
+                    best_payoff = i
             
-            if best_payoff and best_overlap >= 2:
-                idx, payoff = best_payoff
-                used_payoffs.add(idx)
-                payoff.seed_id = seed.id
+            if best_payoff is not None and best_overlap >= 2:
+                used_payoffs.add(best_payoff)
                 
                 # 회수 품질 평가
                 if best_overlap >= 4:
-                    payoff.resolution_quality = "strong"
+                    payoff = payoffs.to_payoff(best_payoff, seed.id, "strong")
                     matched.append((seed, payoff))
                 else:
-                    payoff.resolution_quality = "weak"
+                    payoff = payoffs.to_payoff(best_payoff, seed.id, "weak")
                     matched.append((seed, payoff))
                     weak.append({
                         "seed": seed.model_dump(),
@@ -285,7 +354,7 @@ class ForeshadowAgent:
         
         for seed in orphaned:
             suggestion = {
-                "id": f"sug_{uuid4().hex[:8]}",
+                "id": f"sug_{token_hex(4)}",
                 "type": "opportunity",
                 "title": f"미회수 복선: {seed.description[:30]}",
                 "message": f"{seed.planted_at}에 심어진 '{seed.planted_text[:50]}...'이 회수되지 않았습니다.",
@@ -306,7 +375,7 @@ class ForeshadowAgent:
         
         for w in weak[:5]:  # 약한 회수 상위 5개
             suggestion = {
-                "id": f"sug_{uuid4().hex[:8]}",
+                "id": f"sug_{token_hex(4)}",
                 "type": "improvement",
                 "title": "복선 회수 강화 필요",
                 "message": f"'{w['seed']['description'][:30]}'의 회수가 약합니다. 더 명확한 연결이 필요합니다.",
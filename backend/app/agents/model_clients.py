@@ -3,11 +3,13 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, Iterator, List, Optional
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
 from app.agents.agent_types import AgentMessage, AgentRole, ToolCall, ToolSpec
 from app.config import settings
+from app.utils.json_utils import dumps_str, loads
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,8 @@ class GeminiModelClient:
             "response_mime_type": "application/json",
         }
         self._model = self._build_model()
+        # (tool ids, tools, rendered section) for the last tool set seen
+        self._tools_section_cache: Optional[Tuple[Tuple[int, ...], Tuple[ToolSpec, ...], str]] = None
 
     async def complete(
         self,
@@ -72,17 +76,17 @@ class GeminiModelClient:
         model = self._build_model()
         stream = model.generate_content(prompt, stream=True)
         parser = JSONContentStreamParser()
-        raw_text = ""
+        raw_chunks: List[str] = []
         for chunk in stream:
             chunk_text = (chunk.text or "")
             if not chunk_text:
                 continue
-            raw_text += chunk_text
+            raw_chunks.append(chunk_text)
             delta = parser.feed(chunk_text)
             if delta:
                 yield delta
 
-        return self._build_message(raw_text, tools, parser.content)
+        return self._build_message("".join(raw_chunks), tools, parser.content)
 
     def _build_model(self):
         return self._genai.GenerativeModel(
@@ -91,14 +95,27 @@ class GeminiModelClient:
             generation_config=self._generation_config,
         )
 
-    def _build_prompt(self, messages: List[AgentMessage], tools: List[ToolSpec]) -> str:
+    def _tools_section(self, tools: List[ToolSpec]) -> str:
+        # Registry specs are static per process, so reuse the rendered schemas
+        # while the same ToolSpec objects are passed in.
+        key = tuple(map(id, tools))
+        cached = self._tools_section_cache
+        if cached is not None and cached[0] == key:
+            return cached[2]
+
         tool_lines = []
         for tool in tools:
             tool_lines.append(
                 f"- {tool.name}: {tool.description}\n  input_schema: "
-                f"{json.dumps(tool.input_schema, ensure_ascii=True)}"
+                f"{dumps_str(tool.input_schema)}"
             )
         tools_section = "\n".join(tool_lines) if tool_lines else "- none"
+        # Keep the specs referenced so their ids cannot be reused while cached
+        self._tools_section_cache = (key, tuple(tools), tools_section)
+        return tools_section
+
+    def _build_prompt(self, messages: List[AgentMessage], tools: List[ToolSpec]) -> str:
+        tools_section = self._tools_section(tools)
 
         convo_lines = []
         for message in messages:
@@ -120,7 +137,7 @@ class GeminiModelClient:
 
     def _parse_json(self, text: str) -> Dict[str, Any]:
         try:
-            parsed = json.loads(text)
+            parsed = loads(text)
             if isinstance(parsed, dict):
                 return parsed
         except json.JSONDecodeError:
@@ -133,7 +150,7 @@ class GeminiModelClient:
         end = cleaned.rfind("}")
         if start != -1 and end != -1 and end > start:
             try:
-                parsed = json.loads(cleaned[start : end + 1])
+                parsed = loads(cleaned[start : end + 1])
                 if isinstance(parsed, dict):
                     return parsed
             except json.JSONDecodeError:
@@ -188,22 +205,42 @@ class GeminiModelClient:
 
 
 class JSONContentStreamParser:
+    _CONTENT_KEY = "\"content\""
+    # Characters that end a plain run inside the JSON string value
+    _SPECIAL_RE = re.compile(r'["\\]')
+    _ESCAPES = {
+        "\"": "\"",
+        "\\": "\\",
+        "/": "/",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+        "b": "\b",
+        "f": "\f",
+    }
+    _HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
     def __init__(self) -> None:
+        # Only text before the content value is buffered; once the value
+        # starts, each chunk is decoded on its own.
         self.buffer = ""
-        self.cursor = 0
         self.content_started = False
         self.content_ended = False
         self.escape = False
         self.unicode_escape: Optional[str] = None
-        self.content = ""
+        self._content_parts: List[str] = []
+
+    @property
+    def content(self) -> str:
+        return "".join(self._content_parts)
 
     def feed(self, text: str) -> str:
         if self.content_ended:
             return ""
-        self.buffer += text
 
         if not self.content_started:
-            key_index = self.buffer.find("\"content\"")
+            self.buffer += text
+            key_index = self.buffer.find(self._CONTENT_KEY)
             if key_index == -1:
                 return ""
             colon_index = self.buffer.find(":", key_index)
@@ -213,55 +250,51 @@ class JSONContentStreamParser:
             if quote_index == -1:
                 return ""
             self.content_started = True
-            self.cursor = quote_index + 1
+            text = self.buffer[quote_index + 1:]
+            self.buffer = ""
 
         emitted = []
-        while self.cursor < len(self.buffer):
-            ch = self.buffer[self.cursor]
-            self.cursor += 1
-
+        cursor = 0
+        length = len(text)
+        while cursor < length:
             if self.unicode_escape is not None:
-                if ch.lower() in "0123456789abcdef":
+                ch = text[cursor]
+                cursor += 1
+                if ch in self._HEX_DIGITS:
                     self.unicode_escape += ch
                     if len(self.unicode_escape) == 4:
-                        try:
-                            emitted.append(chr(int(self.unicode_escape, 16)))
-                        except ValueError:
-                            emitted.append("")
+                        emitted.append(chr(int(self.unicode_escape, 16)))
                         self.unicode_escape = None
                 else:
                     self.unicode_escape = None
                 continue
 
             if self.escape:
+                ch = text[cursor]
+                cursor += 1
                 self.escape = False
                 if ch == "u":
                     self.unicode_escape = ""
                     continue
-                mapping = {
-                    "\"": "\"",
-                    "\\": "\\",
-                    "/": "/",
-                    "n": "\n",
-                    "r": "\r",
-                    "t": "\t",
-                    "b": "\b",
-                    "f": "\f",
-                }
-                emitted.append(mapping.get(ch, ch))
+                emitted.append(self._ESCAPES.get(ch, ch))
                 continue
 
-            if ch == "\\":
-                self.escape = True
-                continue
-            if ch == "\"":
+            match = self._SPECIAL_RE.search(text, cursor)
+            if match is None:
+                emitted.append(text[cursor:])
+                break
+            special = match.start()
+            if special > cursor:
+                emitted.append(text[cursor:special])
+            cursor = special + 1
+            if text[special] == "\"":
                 self.content_ended = True
                 break
-            emitted.append(ch)
+            self.escape = True
 
         delta = "".join(emitted)
         if delta:
-            self.content += delta
+            self._content_parts.append(delta)
         return delta
 
 
@@ -8,7 +8,9 @@ Refactored to use shared utilities from tool_utils.py.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.agents.agent_types import (
     ToolCall,
@@ -24,10 +26,40 @@ from app.agents.tool_utils import (
     success_result,
     validation_error,
 )
+from app.config import settings
 from app.logging_config import get_logger
 
 logger = get_logger("notebooklm_tools")
 
+NOTEBOOK_LIST_CACHE_TTL_SEC = 60.0
+SOURCE_BATCH_MAX = 50  # userContents per batchCreate request
+
+_READY_STATES = frozenset({"READY", "COMPLETED", "DONE"})  # audio overview terminal states
+
+# (project_number, location, page_size) → (cached_at, notebook list). Enterprise
+# clients are shared by all sessions, so the list is per project, not per session.
+_NotebookListKey = Tuple[Optional[str], Optional[str], int]
+_notebook_list_cache: Dict[_NotebookListKey, Tuple[float, List[Dict[str, Any]]]] = {}
+# same key → in-flight list_notebooks call shared by concurrent handlers
+_notebook_list_inflight: Dict[_NotebookListKey, asyncio.Future] = {}
+_notebook_list_generation = 0
+
+
+def invalidate_notebook_list() -> None:
+    """Drop cached notebook lists (call after creating a notebook).
+
+    In-flight loads are forgotten too, so later callers start a fresh
+    list_notebooks call instead of joining one that predates the change.
+    """
+    global _notebook_list_generation
+    _notebook_list_generation += 1
+    _notebook_list_cache.clear()
+    _notebook_list_inflight.clear()
+
+
+# (notebook_id, audio_overview_id) → (polling task, emitters of the sessions waiting on it)
+_inflight_polls: Dict[Tuple[str, str], Tuple[asyncio.Future, List[Any]]] = {}
+
 
 # =============================================================================
 # Tool Handlers
@@ -43,6 +75,7 @@ async def _create_notebook_handler(
     try:
         client = get_enterprise_client()
         notebook = await client.create_notebook(title)
+        invalidate_notebook_list()
         
         logger.info("Notebook created", extra={
             "session_id": context.session_id,
@@ -101,42 +134,60 @@ async def _add_sources_handler(
         return error_result(call, f"Source addition failed: {e}")
 
 
+# batchCreate userContents entry per source type
+_SOURCE_CONTENTS = {
+    "text": lambda src: {"textContent": {
+        "sourceName": src.get("name", "Unnamed"),
+        "content": src.get("content", ""),
+    }},
+    "web": lambda src: {"webContent": {
+        "url": src.get("url", ""),
+        "sourceName": src.get("name", "Unnamed"),
+    }},
+    "drive": lambda src: {"googleDriveContent": {
+        "documentId": src.get("document_id", ""),
+        "mimeType": src.get("mime_type", "application/vnd.google-apps.document"),
+        "sourceName": src.get("name", "Unnamed"),
+    }},
+}
+
+
 async def _process_sources(
     client: Any,
     notebook_id: str,
     sources: list,
 ) -> list:
-    """Process and add sources to notebook. Extracted for testability."""
-    added = []
-    
-    SOURCE_HANDLERS = {
-        "text": lambda c, nid, src: c.add_text_source(
-            nid, src.get("name", "Unnamed"), src.get("content", "")
-        ),
-        "web": lambda c, nid, src: c.add_web_source(
-            nid, src.get("name", "Unnamed"), src.get("url", "")
-        ),
-        "drive": lambda c, nid, src: c.add_drive_source(
-            nid,
-            src.get("name", "Unnamed"),
-            src.get("document_id", ""),
-            src.get("mime_type", "application/vnd.google-apps.document"),
-        ),
-    }
-    
+    """Add sources to the notebook, keeping input order. Extracted for testability.
+
+    Sources go out through batchCreate, at most SOURCE_BATCH_MAX per request.
+    """
+    accepted = []
     for src in sources:
         src_type = src.get("type", "text")
-        handler = SOURCE_HANDLERS.get(src_type)
-        
-        if handler:
-            result = await handler(client, notebook_id, src)
-            added.append({
-                "source_id": result.source_id,
-                "name": src.get("name", "Unnamed"),
-                "type": src_type,
-            })
+        if src_type in _SOURCE_CONTENTS:
+            accepted.append((src, src_type))
     
-    return added
+    results = []
+    for i in range(0, len(accepted), SOURCE_BATCH_MAX):
+        chunk = accepted[i:i + SOURCE_BATCH_MAX]
+        results.extend(await client.add_sources_batch(
+            notebook_id,
+            [_SOURCE_CONTENTS[src_type](src) for src, src_type in chunk],
+        ))
+    
+    if len(results) != len(accepted):
+        raise RuntimeError(
+            f"Expected {len(accepted)} added sources, got {len(results)}"
+        )
+    
+    return [
+        {
+            "source_id": result.source_id,
+            "name": src.get("name", "Unnamed"),
+            "type": src_type,
+        }
+        for result, (src, src_type) in zip(results, accepted)
+    ]
 
 
 async def _generate_audio_overview_handler(
@@ -203,32 +254,154 @@ async def _poll_audio_overview(
     notebook_id: str,
     overview: Any,
     emitter: Any,
-    max_attempts: int = 12,
-    poll_interval: int = 5,
+    *,
+    max_wait: float = 60.0,
+    poll_backoff_min: float = 0.5,
+    poll_backoff_max: float = 5.0,
+    backoff_base: float = 1.3,
 ) -> Any:
-    """Poll for audio overview completion. Extracted for testability."""
-    READY_STATES = ("READY", "COMPLETED", "DONE")
+    """Wait for an audio overview to finish. Extracted for testability.
+
+    Sessions waiting on the same overview share one polling loop; each joins
+    the loop's subscriber list and receives its progress events. The backoff
+    settings apply when this call starts the loop. The loop is cancelled once
+    its last subscriber stops waiting.
+    """
+    if overview.status in _READY_STATES:
+        return overview
     
-    for attempt in range(max_attempts):
-        if overview.status in READY_STATES:
+    key = (notebook_id, overview.audio_overview_id)
+    inflight = _inflight_polls.get(key)
+    if inflight is None:
+        subscribers = [emitter]
+        task = asyncio.ensure_future(
+            _poll_until_ready(
+                client, notebook_id, overview, subscribers,
+                max_wait=max_wait,
+                poll_backoff_min=poll_backoff_min,
+                poll_backoff_max=poll_backoff_max,
+                backoff_base=backoff_base,
+            )
+        )
+        _inflight_polls[key] = (task, subscribers)
+        task.add_done_callback(lambda done: _forget_poll(key, done))
+    else:
+        task, subscribers = inflight
+        subscribers.append(emitter)
+    
+    try:
+        return await asyncio.shield(task)
+    finally:
+        if emitter in subscribers:
+            subscribers.remove(emitter)
+        if not subscribers and not task.done():
+            # Nobody is waiting any more; stop polling and let the next caller start afresh
+            _forget_poll(key, task)
+            task.cancel()
+
+
+def _forget_poll(key: Tuple[str, str], task: asyncio.Future) -> None:
+    if _inflight_polls.get(key, (None,))[0] is task:
+        del _inflight_polls[key]
+
+
+async def _poll_until_ready(
+    client: Any,
+    notebook_id: str,
+    overview: Any,
+    subscribers: List[Any],
+    max_wait: float = 60.0,
+    poll_backoff_min: float = 0.5,
+    poll_backoff_max: float = 5.0,
+    backoff_base: float = 1.3,
+) -> Any:
+    """Poll with capped exponential backoff, fanning progress out to subscribers.
+
+    Short jobs are picked up within a second or two, long jobs settle at one
+    request per ``poll_backoff_max`` seconds; polling stops after ``max_wait``
+    seconds of wall-clock time.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    attempt = 0
+    
+    while overview.status not in _READY_STATES:
+        elapsed = loop.time() - started
+        if elapsed >= max_wait:
             break
         
-        await asyncio.sleep(poll_interval)
+        delay = min(poll_backoff_max, poll_backoff_min * backoff_base ** attempt)
+        delay *= 1 + random.uniform(-0.1, 0.1)  # jitter so concurrent pollers drift apart
+        await asyncio.sleep(min(delay, max_wait - elapsed))
         overview = await client.get_audio_overview(
             notebook_id, overview.audio_overview_id
         )
+        attempt += 1
         
-        progress = min(95, (attempt + 1) * 8)
-        emitter.emit("agent.audio_overview_progress", {
-            "notebook_id": notebook_id,
-            "audio_overview_id": overview.audio_overview_id,
-            "status": overview.status,
-            "progress": progress,
-        })
+        progress = min(95, int((loop.time() - started) / max_wait * 100))
+        for subscriber in list(subscribers):
+            subscriber.emit("agent.audio_overview_progress", {
+                "notebook_id": notebook_id,
+                "audio_overview_id": overview.audio_overview_id,
+                "status": overview.status,
+                "progress": progress,
+            })
     
     return overview
 
 
+async def _get_notebook_list(client: Any, page_size: int) -> List[Dict[str, Any]]:
+    """Return the notebook list, served from a short-lived cache when fresh.
+
+    Concurrent misses for the same project and page_size share one
+    list_notebooks call.
+    """
+    key = _notebook_list_key(client, page_size)
+    cached = _notebook_list_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < NOTEBOOK_LIST_CACHE_TTL_SEC:
+        return [dict(nb) for nb in cached[1]]
+    
+    inflight = _notebook_list_inflight.get(key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(_load_notebook_list(client, key))
+        _notebook_list_inflight[key] = inflight
+        inflight.add_done_callback(lambda done: _forget_notebook_list_load(key, done))
+    
+    notebook_list = await asyncio.shield(inflight)
+    return [dict(nb) for nb in notebook_list]
+
+
+def _notebook_list_key(client: Any, page_size: int) -> _NotebookListKey:
+    return (
+        getattr(client, "project_number", None),
+        getattr(client, "location", None),
+        page_size,
+    )
+
+
+def _forget_notebook_list_load(key: _NotebookListKey, future: asyncio.Future) -> None:
+    if _notebook_list_inflight.get(key) is future:
+        del _notebook_list_inflight[key]
+
+
+async def _load_notebook_list(client: Any, key: _NotebookListKey) -> List[Dict[str, Any]]:
+    generation = _notebook_list_generation
+    notebooks = await client.list_notebooks(page_size=key[2])
+    notebook_list = [
+        {
+            "notebook_id": nb.notebook_id,
+            "title": nb.title,
+            "user_role": nb.user_role,
+            "is_shared": nb.is_shared,
+        }
+        for nb in notebooks
+    ]
+    # A notebook created while this call was in flight may be missing from it
+    if generation == _notebook_list_generation:
+        _notebook_list_cache[key] = (time.monotonic(), notebook_list)
+    return notebook_list
+
+
 async def _list_notebooks_handler(
     context: ToolContext,
     call: ToolCall,
@@ -238,17 +411,7 @@ async def _list_notebooks_handler(
     
     try:
         client = get_enterprise_client()
-        notebooks = await client.list_notebooks(page_size=page_size)
-        
-        notebook_list = [
-            {
-                "notebook_id": nb.notebook_id,
-                "title": nb.title,
-                "user_role": nb.user_role,
-                "is_shared": nb.is_shared,
-            }
-            for nb in notebooks
-        ]
+        notebook_list = await _get_notebook_list(client, page_size)
         
         logger.info("Notebooks listed", extra={
             "session_id": context.session_id,
@@ -349,11 +512,15 @@ _HANDLERS = {
 }
 
 
+# Spec/handler pairs resolved once at import
+_REGISTRATIONS = tuple(
+    (spec, _HANDLERS[spec.name]) for spec in _SPECS if spec.name in _HANDLERS
+)
+
+
 def register_notebooklm_tools(registry: ToolRegistry) -> None:
     """Register NotebookLM Enterprise tools with the given registry."""
-    for spec in _SPECS:
-        handler = _HANDLERS.get(spec.name)
-        if handler:
-            registry.register(spec, handler)
+    for spec, handler in _REGISTRATIONS:
+        registry.register(spec, handler)
     
-    logger.info(f"Registered {len(_SPECS)} NotebookLM tools")
+    logger.info(f"Registered {len(_REGISTRATIONS)} NotebookLM tools")
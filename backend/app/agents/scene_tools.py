@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from secrets import token_hex
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.agents.agent_types import (
     ToolCall,
     ToolContext,
+    ToolHandler,
     ToolRegistry,
     ToolResult,
     ToolSpec,
@@ -20,148 +21,16 @@ DEFAULT_VIDEO_PROVIDER = "veo-3.1"
 DEFAULT_IMAGE_MODEL = settings.GEMINI_IMAGE_MODEL
 
 
-def register_scene_tools(registry: ToolRegistry) -> None:
-    registry.register(
-        ToolSpec(
-            name="create_scene",
-            description="Create a new scene draft and return its snapshot.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "scene_id": {"type": "string"},
-                    "title": {"type": "string"},
-                    "summary": {"type": "string"},
-                    "style": {"type": "object"},
-                },
-                "required": ["title", "summary"],
-            },
-            output_schema={
-                "type": "object",
-                "properties": {
-                    "scene_id": {"type": "string"},
-                    "title": {"type": "string"},
-                    "summary": {"type": "string"},
-                    "style": {"type": "object"},
-                    "created_at": {"type": "string"},
-                },
-            },
-        ),
-        _create_scene,
-    )
-    registry.register(
-        ToolSpec(
-            name="modify_scene",
-            description="Modify fields of an existing scene draft.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "scene_id": {"type": "string"},
-                    "patch": {"type": "object"},
-                },
-                "required": ["scene_id", "patch"],
-            },
-        ),
-        _modify_scene,
-    )
-    registry.register(
-        ToolSpec(
-            name="split_scene",
-            description="Split a scene into multiple drafts.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "scene_id": {"type": "string"},
-                    "parts": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "title": {"type": "string"},
-                                "summary": {"type": "string"},
-                            },
-                            "required": ["summary"],
-                        },
-                    },
-                },
-                "required": ["scene_id", "parts"],
-            },
-        ),
-        _split_scene,
-    )
-    registry.register(
-        ToolSpec(
-            name="merge_scenes",
-            description="Merge multiple scenes into a new draft.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "scene_ids": {"type": "array", "items": {"type": "string"}},
-                    "title": {"type": "string"},
-                    "summary": {"type": "string"},
-                },
-                "required": ["scene_ids"],
-            },
-        ),
-        _merge_scenes,
-    )
-    registry.register(
-        ToolSpec(
-            name="apply_style",
-            description="Apply a style override to a scene.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "scene_id": {"type": "string"},
-                    "style": {"type": "object"},
-                },
-                "required": ["scene_id", "style"],
-            },
-        ),
-        _apply_style,
-    )
-    registry.register(
-        ToolSpec(
-            name="generate_video",
-            description="Start a video generation task for a scene.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "scene_id": {"type": "string"},
-                    "provider": {"type": "string"},
-                    "quality": {"type": "string"},
-                    "length_sec": {"type": "number"},
-                },
-                "required": ["scene_id"],
-            },
-        ),
-        _generate_video,
-    )
-    registry.register(
-        ToolSpec(
-            name="generate_image",
-            description="Start an image generation task for a scene.",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "scene_id": {"type": "string"},
-                    "prompt": {"type": "string"},
-                    "model": {"type": "string"},
-                    "aspect_ratio": {"type": "string"},
-                    "size": {"type": "string"},
-                },
-                "required": ["scene_id"],
-            },
-        ),
-        _generate_image,
-    )
-
-
 def _scene_store(context: ToolContext) -> Dict[str, Dict[str, Any]]:
     return context.state.artifacts.setdefault(SCENE_STORE_KEY, {})
 
 
+def _utc_timestamp() -> str:
+    return f"{datetime.utcnow().isoformat()}Z"
+
+
 def _build_scene_id(scene_id: Optional[str]) -> str:
-    return scene_id or f"scene_{uuid4().hex[:8]}"
+    return scene_id or f"scene_{token_hex(4)}"
 
 
 async def _create_scene(context: ToolContext, call: ToolCall) -> ToolResult:
@@ -183,7 +52,7 @@ async def _create_scene(context: ToolContext, call: ToolCall) -> ToolResult:
         "title": title,
         "summary": summary,
         "style": style,
-        "created_at": f"{datetime.utcnow().isoformat()}Z",
+        "created_at": _utc_timestamp(),
     }
     store = _scene_store(context)
     store[scene_id] = scene
@@ -195,10 +64,13 @@ async def _create_scene(context: ToolContext, call: ToolCall) -> ToolResult:
 
 
 def _merge_dict(base: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
-    merged = dict(base)
+    merged = base.copy()
     for key, value in patch.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = {**merged[key], **value}
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            nested = current.copy()
+            nested.update(value)
+            merged[key] = nested
         else:
             merged[key] = value
     return merged
@@ -225,7 +97,7 @@ async def _modify_scene(context: ToolContext, call: ToolCall) -> ToolResult:
             error=f"scene_id not found: {scene_id}",
         )
     scene = _merge_dict(scene, patch)
-    scene["updated_at"] = f"{datetime.utcnow().isoformat()}Z"
+    scene["updated_at"] = _utc_timestamp()
     store[scene_id] = scene
     return ToolResult(
         tool_call_id=call.id,
@@ -255,6 +127,7 @@ async def _split_scene(context: ToolContext, call: ToolCall) -> ToolResult:
             error=f"scene_id not found: {scene_id}",
         )
     created: List[Dict[str, Any]] = []
+    created_at = _utc_timestamp()  # one split, one timestamp for every part
     for idx, part in enumerate(parts, start=1):
         if not isinstance(part, dict):
             continue
@@ -269,7 +142,7 @@ async def _split_scene(context: ToolContext, call: ToolCall) -> ToolResult:
             "summary": summary,
             "style": source_scene.get("style", {}),
             "split_from": scene_id,
-            "created_at": f"{datetime.utcnow().isoformat()}Z",
+            "created_at": created_at,
         }
         store[new_id] = scene
         created.append(scene)
@@ -291,7 +164,7 @@ async def _merge_scenes(context: ToolContext, call: ToolCall) -> ToolResult:
             error="scene_ids is required",
         )
     store = _scene_store(context)
-    scenes = [store.get(scene_id) for scene_id in scene_ids if store.get(scene_id)]
+    scenes = [scene for scene in map(store.get, scene_ids) if scene]
     if not scenes:
         return ToolResult(
             tool_call_id=call.id,
@@ -300,7 +173,8 @@ async def _merge_scenes(context: ToolContext, call: ToolCall) -> ToolResult:
             error="no valid scene_ids found",
         )
     title = (args.get("title") or "Merged Scene").strip()
-    summary = (args.get("summary") or " ".join((scene.get("summary") or "") for scene in scenes)).strip()
+    summary = args.get("summary") or " ".join([scene["summary"] for scene in scenes if scene.get("summary")])
+    summary = summary.strip()
     merged_id = _build_scene_id(None)
     scene = {
         "scene_id": merged_id,
@@ -308,7 +182,7 @@ async def _merge_scenes(context: ToolContext, call: ToolCall) -> ToolResult:
         "summary": summary,
         "style": scenes[0].get("style", {}),
         "merged_from": scene_ids,
-        "created_at": f"{datetime.utcnow().isoformat()}Z",
+        "created_at": _utc_timestamp(),
     }
     store[merged_id] = scene
     return ToolResult(
@@ -339,7 +213,7 @@ async def _apply_style(context: ToolContext, call: ToolCall) -> ToolResult:
             error=f"scene_id not found: {scene_id}",
         )
     scene["style"] = _merge_dict(scene.get("style", {}), style)
-    scene["updated_at"] = f"{datetime.utcnow().isoformat()}Z"
+    scene["updated_at"] = _utc_timestamp()
     store[scene_id] = scene
     return ToolResult(
         tool_call_id=call.id,
@@ -358,7 +232,7 @@ async def _generate_video(context: ToolContext, call: ToolCall) -> ToolResult:
             status=ToolTaskState.FAILED,
             error="scene_id is required",
         )
-    task_id = f"task_{uuid4().hex[:8]}"
+    task_id = f"task_{token_hex(4)}"
     provider = (args.get("provider") or DEFAULT_VIDEO_PROVIDER).strip()
     return ToolResult(
         tool_call_id=call.id,
@@ -385,7 +259,7 @@ async def _generate_image(context: ToolContext, call: ToolCall) -> ToolResult:
             status=ToolTaskState.FAILED,
             error="scene_id is required",
         )
-    task_id = f"task_{uuid4().hex[:8]}"
+    task_id = f"task_{token_hex(4)}"
     model = (args.get("model") or DEFAULT_IMAGE_MODEL).strip()
     return ToolResult(
         tool_call_id=call.id,
@@ -401,3 +275,146 @@ async def _generate_image(context: ToolContext, call: ToolCall) -> ToolResult:
             "task_id": task_id,
         },
     )
+
+
+# Specs are built once at import; every agent's registry shares them
+_REGISTRATIONS: Tuple[Tuple[ToolSpec, ToolHandler], ...] = (
+    (
+        ToolSpec(
+            name="create_scene",
+            description="Create a new scene draft and return its snapshot.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "scene_id": {"type": "string"},
+                    "title": {"type": "string"},
+                    "summary": {"type": "string"},
+                    "style": {"type": "object"},
+                },
+                "required": ["title", "summary"],
+            },
+            output_schema={
+                "type": "object",
+                "properties": {
+                    "scene_id": {"type": "string"},
+                    "title": {"type": "string"},
+                    "summary": {"type": "string"},
+                    "style": {"type": "object"},
+                    "created_at": {"type": "string"},
+                },
+            },
+        ),
+        _create_scene,
+    ),
+    (
+        ToolSpec(
+            name="modify_scene",
+            description="Modify fields of an existing scene draft.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "scene_id": {"type": "string"},
+                    "patch": {"type": "object"},
+                },
+                "required": ["scene_id", "patch"],
+            },
+        ),
+        _modify_scene,
+    ),
+    (
+        ToolSpec(
+            name="split_scene",
+            description="Split a scene into multiple drafts.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "scene_id": {"type": "string"},
+                    "parts": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "title": {"type": "string"},
+                                "summary": {"type": "string"},
+                            },
+                            "required": ["summary"],
+                        },
+                    },
+                },
+                "required": ["scene_id", "parts"],
+            },
+        ),
+        _split_scene,
+    ),
+    (
+        ToolSpec(
+            name="merge_scenes",
+            description="Merge multiple scenes into a new draft.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "scene_ids": {"type": "array", "items": {"type": "string"}},
+                    "title": {"type": "string"},
+                    "summary": {"type": "string"},
+                },
+                "required": ["scene_ids"],
+            },
+        ),
+        _merge_scenes,
+    ),
+    (
+        ToolSpec(
+            name="apply_style",
+            description="Apply a style override to a scene.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "scene_id": {"type": "string"},
+                    "style": {"type": "object"},
+                },
+                "required": ["scene_id", "style"],
+            },
+        ),
+        _apply_style,
+    ),
+    (
+        ToolSpec(
+            name="generate_video",
+            description="Start a video generation task for a scene.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "scene_id": {"type": "string"},
+                    "provider": {"type": "string"},
+                    "quality": {"type": "string"},
+                    "length_sec": {"type": "number"},
+                },
+                "required": ["scene_id"],
+            },
+        ),
+        _generate_video,
+    ),
+    (
+        ToolSpec(
+            name="generate_image",
+            description="Start an image generation task for a scene.",
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "scene_id": {"type": "string"},
+                    "prompt": {"type": "string"},
+                    "model": {"type": "string"},
+                    "aspect_ratio": {"type": "string"},
+                    "size": {"type": "string"},
+                },
+                "required": ["scene_id"],
+            },
+        ),
+        _generate_image,
+    ),
+)
+
+
+def register_scene_tools(registry: ToolRegistry) -> None:
+    for spec, handler in _REGISTRATIONS:
+        registry.register(spec, handler)
@@ -14,6 +14,7 @@ from app.agents.agent_types import (
     ToolResult,
     ToolTaskState,
 )
+from app.config import settings
 from app.logging_config import get_logger
 
 logger = get_logger("tool_utils")
@@ -68,6 +69,8 @@ def validation_error(
 class EventEmitter:
     """Context-aware event emitter for tool handlers."""
     
+    __slots__ = ("_emit_fn", "_call")
+    
     def __init__(self, context: ToolContext, call: ToolCall):
         self._emit_fn = context.emit_event
         self._call = call
@@ -109,6 +112,8 @@ def create_emitter(context: ToolContext, call: ToolCall) -> EventEmitter:
 # Enterprise Client Factory
 # =============================================================================
 
+ENTERPRISE_CLIENT_CACHE_MAX_ENTRIES = 16
+
 _enterprise_client_cache: Dict[str, Any] = {}
 
 
@@ -121,11 +126,9 @@ def get_enterprise_client(
     """
     Get a NotebookLM Enterprise client instance.
     
-    Caches client instances to avoid repeated credential refresh.
+    Caches client instances (bounded, oldest evicted first) so access
+    tokens are reused until they expire.
     """
-    from app.notebooklm_enterprise_client import NotebookLMEnterpriseClient
-    from app.config import settings
-    
     project = project_number or getattr(settings, "GCP_PROJECT_NUMBER", "239259013228")
     creds = credentials_path or getattr(settings, "GCP_CREDENTIALS_PATH", None)
     
@@ -134,12 +137,17 @@ def get_enterprise_client(
     if use_cache and cache_key in _enterprise_client_cache:
         return _enterprise_client_cache[cache_key]
     
+    # Imported on a cache miss only: google-auth adds ~170ms to cold start
+    from app.notebooklm_enterprise_client import NotebookLMEnterpriseClient
+    
     client = NotebookLMEnterpriseClient(
         project_number=project,
         credentials_path=creds,
     )
     
     if use_cache:
+        if len(_enterprise_client_cache) >= ENTERPRISE_CLIENT_CACHE_MAX_ENTRIES:
+            _enterprise_client_cache.pop(next(iter(_enterprise_client_cache)))
         _enterprise_client_cache[cache_key] = client
     
     return client
@@ -157,6 +165,8 @@ def clear_client_cache() -> None:
 class TokenUsageTracker:
     """Accumulates token usage across multiple operations."""
     
+    __slots__ = ("_input", "_output", "_total")
+    
     def __init__(self):
         self._input = 0
         self._output = 0
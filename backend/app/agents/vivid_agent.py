@@ -1,7 +1,6 @@
 """Chat-first agent core for Vivid Studio."""
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import List, Optional, Protocol
 
@@ -19,6 +18,7 @@ from app.agents.notebooklm_tools import register_notebooklm_tools
 from app.agents.scene_tools import register_scene_tools
 from app.agents.workflow_tools import register_workflow_tools
 from app.logging_config import get_logger
+from app.utils.json_utils import dumps_str
 
 logger = get_logger("vivid_agent")
 
@@ -60,7 +60,7 @@ class MemoryManager:
             )
         if state.metadata:
             try:
-                metadata_str = json.dumps(state.metadata, ensure_ascii=True)
+                metadata_str = dumps_str(state.metadata)
             except TypeError:
                 metadata_str = str(state.metadata)
             if len(metadata_str) > self.max_summary_chars:
@@ -6,7 +6,6 @@ enabling chat-first workflow generation.
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict
 from typing import Any, Dict, Optional
 
 from app.agents.agent_types import (
@@ -17,11 +16,13 @@ from app.agents.agent_types import (
     ToolSpec,
     ToolTaskState,
 )
-from app.agents.director import DirectorAgent, OutputType, VibeInput
+from app.agents.director import DirectorAgent, OutputType, VibeInput, list_preset_payloads
 from app.logging_config import get_logger
 
 logger = get_logger("workflow_tools")
 
+_PLAN_DUMP_EXCLUDE = {"nodes": {"__all__": {"input_handles", "output_handles"}}}
+
 
 async def _compile_workflow_handler(
     context: ToolContext,
@@ -66,40 +67,8 @@ async def _compile_workflow_handler(
         
         plan = await director.interpret_vibe(vibe_input)
         
-        # Serialize WorkflowPlan to dict
-        # Handle nested dataclasses
-        plan_dict = {
-            "workflow_id": plan.workflow_id,
-            "estimated_duration_sec": plan.estimated_duration_sec,
-            "agent_assignments": plan.agent_assignments,
-            "capsule_id": plan.capsule_id,
-            "logic_vector": plan.logic_vector,
-            "persona_vector": plan.persona_vector,
-            "narrative_dna": asdict(plan.narrative_dna) if plan.narrative_dna else None,
-            "nodes": [
-                {
-                    "id": n.id,
-                    "type": n.type,
-                    "category": n.category.value if hasattr(n.category, 'value') else n.category,
-                    "label": n.label,
-                    "description": n.description,
-                    "position": n.position,
-                    "ai_model": n.ai_model,
-                    "data": n.data,
-                }
-                for n in plan.nodes
-            ],
-            "edges": [
-                {
-                    "id": e.id,
-                    "source": e.source,
-                    "target": e.target,
-                    "source_handle": e.source_handle,
-                    "target_handle": e.target_handle,
-                }
-                for e in plan.edges
-            ],
-        }
+        # Serialize WorkflowPlan to a JSON-safe dict (handles stay canvas-only)
+        plan_dict = plan.model_dump(mode="json", exclude=_PLAN_DUMP_EXCLUDE)
         
         logger.info(
             "Workflow compiled successfully",
@@ -136,17 +105,7 @@ async def _list_vibe_presets_handler(
 ) -> ToolResult:
     """사용 가능한 바이브 프리셋 목록을 반환합니다."""
     try:
-        director = DirectorAgent()
-        presets = []
-        for preset_id, preset in director.presets.items():
-            presets.append({
-                "id": preset.id,
-                "title": preset.title,
-                "tone": preset.tone,
-                "visual_style": preset.visual_style,
-                "emotional_arc": preset.emotional_arc,
-                "reference_works": preset.reference_works,
-            })
+        presets = list_preset_payloads()
         
         return ToolResult(
             tool_call_id=call.id,
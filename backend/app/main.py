@@ -28,6 +28,7 @@ from app.routers.content_metrics import router as content_metrics_router
 from app.routers.health import router as health_router
 from app.routers.data_deletion import router as data_deletion_router
 from app.routers.director import router as director_router
+from app.agents.director import NarrativeDNA, WorkflowPlan
 from app.routers.agent import router as agent_router
 from app.seed import seed_auteur_data
 from app.middleware.rate_limit import setup_rate_limiting
@@ -41,6 +42,10 @@ async def lifespan(app: FastAPI):
     await init_db(drop_all=settings.SEED_AUTEUR_DATA)
     if settings.SEED_AUTEUR_DATA:
         await seed_auteur_data()
+
+    # Build deferred director schemas before the first /interpret-vibe request
+    NarrativeDNA.model_rebuild()
+    WorkflowPlan.model_rebuild()
     
     # Initialize Arq Redis Pool
     app.state.arq_pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
@@ -181,27 +181,42 @@ def _default_storyboard_shot(idx: int) -> str:
     return shots[(idx - 1) % len(shots)]
 
 
+_model = None
+
+
+def _get_model():
+    """Get or create the shared Gemini model.
+
+    genai.configure() drops the SDK's cached service clients, so it runs
+    once per process; later calls reuse the same client and connection.
+    """
+    global _model
+    if _model is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        _model = genai.GenerativeModel(
+            settings.GEMINI_MODEL,
+            generation_config={
+                "response_mime_type": "application/json",
+                "temperature": 0.3,
+            },
+        )
+    return _model
+
+
 def _call_gemini(prompt: str, context: str, max_retries: int = 3) -> Dict[str, Any]:
     """Call Gemini API and parse JSON response."""
-    import google.generativeai as genai
-    
     if not settings.GEMINI_API_KEY:
         raise NotebookLMClientError("GEMINI_API_KEY not configured")
     
-    genai.configure(api_key=settings.GEMINI_API_KEY)
-    model = genai.GenerativeModel(settings.GEMINI_MODEL)
+    model = _get_model()
     
     full_prompt = f"{prompt}\n\n### Context:\n{context}\n\n### Response (JSON only):"
     
     for attempt in range(max_retries):
         try:
-            response = model.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    response_mime_type="application/json",
-                    temperature=0.3,
-                ),
-            )
+            response = model.generate_content(full_prompt)
             text = response.text.strip()
             return json.loads(text)
         except json.JSONDecodeError as e:
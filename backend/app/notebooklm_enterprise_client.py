@@ -142,7 +142,9 @@ class NotebookLMEnterpriseClient:
                     ]
                 )
         
-        self._credentials.refresh(Request())
+        # 만료(또는 만료 임박) 시에만 갱신 - 캐시된 클라이언트는 토큰을 재사용
+        if not self._credentials.valid:
+            self._credentials.refresh(Request())
         return self._credentials.token
     
     def _get_headers(self) -> Dict[str, str]:
@@ -445,6 +447,9 @@ class NotebookLMEnterpriseClient:
         Args:
             notebook_id: 대상 노트북 ID
             sources: 소스 목록 (textContent, webContent, googleDriveContent 중 하나)
+        
+        Returns:
+            sources와 같은 순서·같은 길이의 SourceInfo 목록 (ID 누락 시 빈 문자열)
         """
         url = f"{self._notebooks_url(notebook_id)}/sources:batchCreate"
         
@@ -457,14 +462,18 @@ class NotebookLMEnterpriseClient:
             resp.raise_for_status()
             data = resp.json()
         
+        source_ids = data.get("sourceIds", [])
+        logger.info(f"Added {len(source_ids)} sources in batch")
+        
+        # batch 응답에는 이름이 없으므로 요청의 sourceName으로 채움
         results = []
-        for source in data.get("sourceIds", []):
+        for i, user_content in enumerate(sources):
+            source = source_ids[i] if i < len(source_ids) else {}
+            content = next(iter(user_content.values()), {})
             results.append(SourceInfo(
                 source_id=source.get("id", ""),
-                name=""  # batch에서는 개별 이름 반환 안됨
+                name=content.get("sourceName", "")
             ))
-        
-        logger.info(f"Added {len(results)} sources in batch")
         return results
     
     async def get_source(self, notebook_id: str, source_id: str) -> Dict[str, Any]:
@@ -99,9 +99,9 @@ async def _get_or_create_profile(db: AsyncSession, user_id: str) -> AffiliatePro
     for _ in range(5):
         code = _generate_affiliate_code()
         result = await db.execute(
-            select(AffiliateProfile).where(AffiliateProfile.affiliate_code == code)
+            select(AffiliateProfile.id).where(AffiliateProfile.affiliate_code == code).limit(1)
         )
-        if result.scalars().first() is None:
+        if result.scalar() is None:
             profile = AffiliateProfile(user_id=user_id, affiliate_code=code)
             db.add(profile)
             await db.commit()
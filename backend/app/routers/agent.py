@@ -23,6 +23,7 @@ from app.config import settings
 from app.database import get_db
 from app.logging_config import get_logger
 from app.models import AgentArtifact, AgentMessage as AgentMessageRecord, AgentSession
+from app.utils.json_utils import dumps_str
 
 router = APIRouter(prefix="/agent", tags=["agent"])
 logger = get_logger("agent_router")
@@ -157,7 +158,7 @@ def _format_sse(event_type: str, data: dict) -> str:
     return (
         f"id: {data['event_id']}\n"
         f"event: {event_type}\n"
-        f"data: {json.dumps(data, ensure_ascii=True)}\n\n"
+        f"data: {dumps_str(data)}\n\n"
     )
 
 
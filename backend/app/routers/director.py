@@ -5,7 +5,7 @@ Director Router - AI 총감독 API
 """
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from app.agents.director import (
@@ -13,8 +13,8 @@ from app.agents.director import (
     VibeInput,
     WorkflowPlan,
     NarrativeDNA,
-    VibePreset,
-    VIBE_PRESETS,
+    get_preset_json,
+    get_preset_list_json,
 )
 from app.logging_config import get_logger
 
@@ -51,17 +51,15 @@ class PresetListResponse(BaseModel):
 
 
 @router.get("/presets", response_model=PresetListResponse)
-async def list_presets() -> PresetListResponse:
+async def list_presets() -> Response:
     """
     사용 가능한 바이브 프리셋 목록을 반환합니다.
     """
-    return PresetListResponse(
-        presets=[preset.model_dump() for preset in VIBE_PRESETS.values()]
-    )
+    return Response(content=get_preset_list_json(), media_type="application/json")
 
 
 @router.post("/interpret-vibe", response_model=VibeInterpretResponse)
-async def interpret_vibe(request: VibeInterpretRequest) -> VibeInterpretResponse:
+async def interpret_vibe(request: VibeInterpretRequest) -> Response:
     """
     바이브 입력을 해석하여 워크플로우 계획을 생성합니다.
     
@@ -95,17 +93,8 @@ async def interpret_vibe(request: VibeInterpretRequest) -> VibeInterpretResponse
         
         workflow = await director_agent.interpret_vibe(vibe_input)
         
-        return VibeInterpretResponse(
-            workflow_id=workflow.workflow_id,
-            nodes=[node.model_dump() for node in workflow.nodes],
-            edges=[edge.model_dump() for edge in workflow.edges],
-            narrative_dna=workflow.narrative_dna.model_dump(),
-            estimated_duration_sec=workflow.estimated_duration_sec,
-            agent_assignments=workflow.agent_assignments,
-            capsule_id=workflow.capsule_id,
-            logic_vector=workflow.logic_vector,
-            persona_vector=workflow.persona_vector,
-        )
+        # WorkflowPlan has exactly the VibeInterpretResponse fields; serialize once in pydantic-core
+        return Response(content=workflow.model_dump_json(), media_type="application/json")
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -115,14 +104,14 @@ async def interpret_vibe(request: VibeInterpretRequest) -> VibeInterpretResponse
 
 
 @router.get("/presets/{preset_id}")
-async def get_preset(preset_id: str) -> dict:
+async def get_preset(preset_id: str) -> Response:
     """
     특정 프리셋의 상세 정보를 반환합니다.
     """
-    preset = VIBE_PRESETS.get(preset_id)
-    if not preset:
+    preset_json = get_preset_json(preset_id)
+    if preset_json is None:
         raise HTTPException(status_code=404, detail=f"Preset not found: {preset_id}")
-    return preset.model_dump()
+    return Response(content=preset_json, media_type="application/json")
 
 
 # --- DNA Compliance API ---
@@ -0,0 +1,39 @@
+"""
+Fast JSON Helpers
+=================
+orjson-backed encoding shared by the agent tool-result and SSE paths.
+
+Usage:
+    from app.utils.json_utils import dumps, dumps_str
+
+    body = dumps(payload)          # UTF-8 bytes
+    content = dumps_str(payload)   # str for message content / SSE lines
+"""
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes."""
+    return orjson.dumps(value, default=_default, option=_OPTIONS)
+
+
+def dumps_str(value: Any) -> str:
+    """Serialize to a JSON string."""
+    return orjson.dumps(value, default=_default, option=_OPTIONS).decode()
+
+
+loads = orjson.loads
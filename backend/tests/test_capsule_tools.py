@@ -0,0 +1,39 @@
+import asyncio
+
+from app.agents import capsule_tools
+
+
+class _RecordingEmitter:
+    def __init__(self) -> None:
+        self.events = []
+
+    def emit(self, event_type, payload):
+        self.events.append((event_type, payload["name"], payload["progress"]))
+
+
+def test_analysis_progress_keeps_step_order(monkeypatch) -> None:
+    monkeypatch.setattr(capsule_tools, "extract_logic_vector", lambda pack, cid: ({"cut": 1}, {}))
+    monkeypatch.setattr(capsule_tools, "extract_persona_vector", lambda pack, cid: ({"tone": []}, {}))
+    monkeypatch.setattr(capsule_tools, "generate_variation_guide", lambda lv, pv, cid: ({}, {}))
+    monkeypatch.setattr(capsule_tools, "generate_claims_with_evidence", lambda guide, pack: ([], {}))
+    monkeypatch.setattr(capsule_tools, "generate_story_beats", lambda *args: [])
+    monkeypatch.setattr(capsule_tools, "generate_storyboard_cards", lambda *args: [])
+    emitter = _RecordingEmitter()
+
+    summary, _, _ = asyncio.run(
+        capsule_tools._run_analysis_pipeline({"pack_id": "p"}, "auteur.bong-joon-ho", emitter)
+    )
+
+    assert summary["logic_vector"] == {"cut": 1}
+    assert [(name, progress) for _, name, progress in emitter.events] == [
+        ("logic_vector", 0),
+        ("logic_vector", 20),
+        ("persona_vector", 20),
+        ("persona_vector", 40),
+        ("variation_guide", 40),
+        ("variation_guide", 60),
+        ("claims", 60),
+        ("claims", 80),
+        ("storyboard", 80),
+        ("storyboard", 100),
+    ]
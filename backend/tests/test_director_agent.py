@@ -0,0 +1,147 @@
+import asyncio
+
+from app.agents import director
+
+
+def test_preset_dna_is_built_once_per_preset() -> None:
+    preset = director.VIBE_PRESETS["noir_seoul"]
+    first = director.DirectorAgent()._preset_to_dna(preset, director.OutputType.SHORT_DRAMA)
+    # 도구 경로처럼 매번 새 에이전트를 만들어도 캐시를 공유
+    second = director.DirectorAgent()._preset_to_dna(preset, director.OutputType.AD)
+
+    assert first is second
+    assert first.core_theme == "냉소"
+    assert first.secondary_themes == ["갈등", "희망"]
+
+
+def test_conflicting_tones_union_without_duplicates() -> None:
+    tones = director.DirectorAgent._get_conflicting_tones(["어둡고", "어둡고", "유쾌한", "없는 톤"])
+
+    assert sorted(tones) == sorted(["밝은", "경쾌한", "우울한", "어두운"])
+    assert director.DirectorAgent._get_conflicting_tones([]) == []
+
+
+def test_notebooklm_analysis_is_cached_per_capsule(monkeypatch) -> None:
+    calls = []
+
+    def fake_analysis(source_pack, capsule_id):
+        calls.append(source_pack["pack_id"])
+        if capsule_id == "auteur.broken":
+            return {"summary": "failed", "error": "boom"}, []
+        return {"logic_vector": {"cut_density": 0.4}, "persona_vector": {"tone": ["dry"]}}, []
+
+    monkeypatch.setattr(director, "run_notebooklm_analysis", fake_analysis)
+    monkeypatch.setattr(director, "_notebooklm_cache", director._TTLCache(60, 8))
+    dna = director.NarrativeDNA(core_theme="theme", overall_tone="tone", visual_style="style")
+
+    async def run(capsule_id):
+        # 도구 경로처럼 호출마다 새 에이전트
+        agent = director.DirectorAgent()
+        return await agent._analyze_with_notebooklm(dna, director.OutputType.AD, capsule_id)
+
+    first = asyncio.run(run("auteur.bong-joon-ho"))
+    second = asyncio.run(run("auteur.bong-joon-ho"))
+    assert first == second == ({"cut_density": 0.4}, {"tone": ["dry"]})
+    assert len(calls) == 1
+
+    asyncio.run(run("auteur.broken"))
+    asyncio.run(run("auteur.broken"))
+    assert len(calls) == 3
+
+
+def test_template_nodes_get_their_own_data() -> None:
+    agent = director.DirectorAgent()
+    dark = director.NarrativeDNA(core_theme="t", overall_tone="어둡고", visual_style="누아르")
+    bright = director.NarrativeDNA(core_theme="t", overall_tone="밝은", visual_style="팝")
+
+    first = {node.id: node for node in agent._create_drama_nodes(dark, dark.model_dump())}
+    second = {node.id: node for node in agent._create_drama_nodes(bright, bright.model_dump())}
+    first["script_gen"].data["persona_tone"] = ["dry"]
+
+    assert first["script_gen"].data["tone"] == "어둡고"
+    assert second["script_gen"].data["tone"] == "밝은"
+    assert "persona_tone" not in second["script_gen"].data
+    assert second["storyboard"].data == {"visual_style": "팝", "aspect_ratio": "16:9"}
+    assert second["dna_check"].data["narrative_dna"]["overall_tone"] == "밝은"
+
+
+def test_genre_detection_keeps_genre_order(caplog) -> None:
+    agent = director.DirectorAgent()
+    dna = director.NarrativeDNA(
+        core_theme="추격 끝의 사랑",
+        secondary_themes=["공포"],
+        overall_tone="긴장",
+        visual_style="v",
+    )
+
+    with caplog.at_level("INFO"):
+        assert agent._detect_and_create_genre_nodes(dna, director.OutputType.SHORT_DRAMA) == ([], [])
+
+    assert "['horror', 'romance', 'action']" in caplog.text
+
+
+def test_persona_applies_only_to_ai_nodes() -> None:
+    agent = director.DirectorAgent()
+    dna = director.NarrativeDNA(core_theme="t", overall_tone="o", visual_style="v")
+    nodes = agent._create_drama_nodes(dna, dna.model_dump())
+
+    agent._apply_persona_to_nodes(nodes, {"tone": ["dry"]}, "auteur.bong-joon-ho")
+
+    by_id = {node.id: node for node in nodes}
+    assert by_id["script_gen"].data["persona_tone"] == ["dry"]
+    assert by_id["script_gen"].data["auteur_params"]["tension_bias"] == 0.8
+    assert by_id["script_gen"].data["capsule_id"] == "auteur.bong-joon-ho"
+    assert "persona_tone" not in by_id["concept_input"].data
+
+
+def test_custom_vibe_reuses_cached_dna(monkeypatch) -> None:
+    prompts = []
+
+    class FakeResponse:
+        text = '{"core_theme": "비 오는 밤", "overall_tone": "서정적", "visual_style": "네온"}'
+
+    class FakeModel:
+        async def generate_content_async(self, prompt):
+            prompts.append(prompt)
+            return FakeResponse()
+
+    monkeypatch.setattr(director, "_get_custom_vibe_model", lambda: FakeModel())
+    monkeypatch.setattr(director, "_custom_vibe_cache", director._TTLCache(60, 8))
+
+    async def interpret(description, output_type=director.OutputType.SHORT_DRAMA):
+        return await director.DirectorAgent()._interpret_custom_vibe(description, output_type)
+
+    first = asyncio.run(interpret("Rainy  Seoul night"))
+    second = asyncio.run(interpret("rainy seoul night "))
+    assert first is second
+    assert first.core_theme == "비 오는 밤"
+    assert len(prompts) == 1
+
+    asyncio.run(interpret("rainy seoul night", director.OutputType.AD))
+    assert len(prompts) == 2
+
+
+def test_ttl_cache_expires_and_evicts_oldest(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(director.time, "monotonic", lambda: now[0])
+    cache = director._TTLCache(ttl_sec=10, max_entries=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    now[0] += 10
+    assert cache.get("c") is None
+
+
+def test_preset_payloads_are_copies_of_shared_data() -> None:
+    first = director.list_preset_payloads()
+    first[0]["tone"].append("변조")
+    first[0]["title"] = "변조"
+
+    second = director.list_preset_payloads()
+    assert second[0]["tone"] == list(director.VIBE_PRESETS[second[0]["id"]].tone)
+    assert second[0]["title"] == director.VIBE_PRESETS[second[0]["id"]].title
+    assert director.loads(director.get_preset_list_json()) == {"presets": second}
@@ -0,0 +1,15 @@
+from app.agents.director import CONNECTION_RULES, HandleType, can_connect
+
+
+def test_can_connect_matches_connection_rules():
+    for source in HandleType:
+        for target in HandleType:
+            assert can_connect(source, target) == (target in CONNECTION_RULES[source])
+
+
+def test_can_connect_examples():
+    assert can_connect(HandleType.IMAGE, HandleType.VIDEO)
+    assert can_connect(HandleType.TEXT, HandleType.ANY)
+    assert can_connect(HandleType.ANY, HandleType.AUDIO)
+    assert not can_connect(HandleType.TEXT, HandleType.IMAGE)
+    assert not can_connect(HandleType.VIDEO, HandleType.AUDIO)
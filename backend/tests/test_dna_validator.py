@@ -0,0 +1,64 @@
+import asyncio
+
+from app.agents.director import NarrativeDNA
+from app.agents.dna_validator import DNAValidator, ViolationType
+
+
+def _dna(**overrides) -> NarrativeDNA:
+    fields = {
+        "core_theme": "theme",
+        "overall_tone": "어둡고",
+        "allowed_tones": ["어둡고"],
+        "forbidden_tones": ["밝은"],
+        "visual_style": "필름 누아르, 네온 조명",
+    }
+    fields.update(overrides)
+    return NarrativeDNA(**fields)
+
+
+def test_conflicting_and_forbidden_keywords_are_reported() -> None:
+    content = "햇살이 빛나는 거리에서 웃음이 터졌다."
+    result = asyncio.run(DNAValidator().check_compliance(content, "script", _dna(), node_id="n1"))
+
+    mismatches = [i.actual for i in result.issues if i.type == ViolationType.TONE_MISMATCH]
+    forbidden = [i.actual for i in result.issues if i.type == ViolationType.FORBIDDEN_ELEMENT]
+    assert mismatches == ["'햇살' 발견", "'빛나는' 발견", "'빛' 발견", "'웃음' 발견"]
+    assert forbidden == ["'햇살' 발견", "'빛나는' 발견", "'빛' 발견"]
+    assert result.content_id == "n1"
+    assert not result.is_compliant
+
+
+def test_compliant_content_scores_full() -> None:
+    result = asyncio.run(DNAValidator().check_compliance("어둠 속 고독", "script", _dna()))
+
+    assert result.issues == []
+    assert result.compliance_score == 1.0
+    assert result.is_compliant
+
+
+def test_repeated_check_reuses_result_with_fresh_content_id() -> None:
+    validator = DNAValidator()
+    dna = _dna()
+    content = "햇살이 빛나는 거리"
+
+    async def run():
+        first = await validator.check_compliance(content, "script", dna, node_id="n1")
+        second = await validator.check_compliance(content, "script", dna)
+        dna.forbidden_tones.clear()
+        third = await validator.check_compliance(content, "script", dna)
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+
+    assert second.content_id != "n1"
+    assert [i.model_dump(exclude={"id"}) for i in second.issues] == [
+        i.model_dump(exclude={"id"}) for i in first.issues
+    ]
+    # 캐시 적중이어도 이슈 ID는 결과마다 새로 발급
+    assert not {i.id for i in first.issues} & {i.id for i in second.issues}
+    assert second.issues[0] is not first.issues[0]
+    # DNA 리스트가 제자리에서 바뀌어도 지문이 달라져 캐시를 쓰지 않음
+    assert not any(i.type == ViolationType.FORBIDDEN_ELEMENT for i in third.issues)
+    assert len(validator._compliance_cache) == 2
+    # 키에는 콘텐츠 원문 대신 고정 길이 다이제스트만 보관
+    assert all(len(key[0]) == 16 for key in validator._compliance_cache)
@@ -0,0 +1,55 @@
+import asyncio
+
+from app.agents.foreshadow_agent import ForeshadowAgent
+
+SCRIPT = (
+    "그는 예전에 오래된 시계를 몰래 숨겼다. 언젠가 그 비밀이 드러날 것이다. "
+    "항상 기억해. 그때 그 낡은 상자를 떠올리며 깨달았다. 사실은 시계가 비밀이었다. "
+)
+
+
+def test_seeds_are_capped_and_located_by_segment() -> None:
+    agent = ForeshadowAgent()
+    segments = [{"label": "1막", "content": SCRIPT}, {"label": "2막", "content": SCRIPT}]
+
+    seeds = agent._detect_seeds(SCRIPT * 2, segments)
+    payoffs = agent._detect_payoffs(SCRIPT * 2, segments)
+
+    assert len(seeds) == 20
+    assert seeds[0].description == "object: 오래된 시계를"
+    assert {seed.planted_at for seed in seeds} == {"1막", "2막"}
+    assert payoffs.locations == ["1막", "2막"] * 4
+
+
+def test_analysis_reports_orphans_and_score() -> None:
+    result = asyncio.run(ForeshadowAgent().analyze_narrative(SCRIPT * 3))
+
+    assert result.total_seeds == 20
+    assert result.resolved_seeds + len(result.orphaned_seeds) == result.total_seeds
+    assert 0.0 <= result.analysis_score <= 1.0
+    assert len(result.suggestions) >= len(result.orphaned_seeds)
+
+
+def test_find_segment_skips_empty_segments_and_falls_back_to_acts() -> None:
+    agent = ForeshadowAgent()
+    index = agent._build_segment_index([
+        {"label": "도입", "content": "abc"},
+        {"label": "빈", "content": ""},
+        {"content": "defg"},
+    ])
+
+    assert agent._find_segment(2, "x" * 10, index) == "도입"
+    assert agent._find_segment(3, "x" * 10, index) == "세그먼트 3"
+    assert agent._find_segment(9, "x" * 10, index) == "3막 (결말)"
+    assert agent._find_segment(0, "x" * 10, None) == "1막 (도입)"
+
+
+def test_ascii_script_skips_korean_only_patterns() -> None:
+    agent = ForeshadowAgent()
+    script = "He hid the mysterious watch. Someday the secret will come out. " * 20
+
+    assert script.isascii()
+    assert agent._detect_seeds(script) == []
+    assert len(agent._detect_payoffs(script)) == 0
+    # 한글 패턴은 비ASCII 텍스트에서 계속 탐지
+    assert agent._detect_seeds(script + SCRIPT)
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import BaseModel
+
+from app.utils.json_utils import dumps, dumps_str, loads
+
+
+class _Payload(BaseModel):
+    name: str
+
+
+def test_dumps_encodes_models_sets_and_datetimes() -> None:
+    value = {
+        "model": _Payload(name="a"),
+        "tags": frozenset({"x"}),
+        "at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        1: "non-str key",
+    }
+
+    assert loads(dumps(value)) == {
+        "model": {"name": "a"},
+        "tags": ["x"],
+        "at": "2026-01-01T00:00:00Z",
+        "1": "non-str key",
+    }
+
+
+def test_dumps_rejects_unknown_types() -> None:
+    with pytest.raises(TypeError):
+        dumps_str({"value": object()})
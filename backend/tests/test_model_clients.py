@@ -0,0 +1,32 @@
+from app.agents.model_clients import GeminiModelClient, JSONContentStreamParser
+
+
+def _feed_all(chunks):
+    parser = JSONContentStreamParser()
+    deltas = [parser.feed(chunk) for chunk in chunks]
+    return parser, deltas
+
+
+def test_stream_parser_decodes_content_split_across_chunks() -> None:
+    doc = '{"content": "a\\n\\"b\\" \\u00e9\\\\ 끝", "tool_calls": []}'
+    chunks = [doc[i:i + 3] for i in range(0, len(doc), 3)]
+    parser, deltas = _feed_all(chunks)
+
+    assert parser.content == 'a\n"b" é\\ 끝'
+    assert "".join(deltas) == parser.content
+    assert parser.content_ended
+
+
+def test_stream_parser_ignores_text_after_content() -> None:
+    parser, deltas = _feed_all(['{"con', 'tent"', ': "hi', '", "x": "no"}', '"more"'])
+
+    assert deltas == ["", "", "hi", "", ""]
+    assert parser.content == "hi"
+
+
+def test_parse_json_accepts_plain_and_fenced_responses() -> None:
+    client = GeminiModelClient.__new__(GeminiModelClient)  # parsing needs no API client
+
+    assert client._parse_json('{"content": "hi", "tool_calls": []}') == {"content": "hi", "tool_calls": []}
+    assert client._parse_json('```json\n{"content": "x"}\n```') == {"content": "x"}
+    assert client._parse_json("not json") == {"content": "not json", "tool_calls": []}
@@ -0,0 +1,77 @@
+import asyncio
+import inspect
+
+from app import notebooklm_enterprise_client
+from app.notebooklm_enterprise_client import NotebookLMEnterpriseClient
+
+
+class _Response:
+    def __init__(self, data) -> None:
+        self._data = data
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self):
+        return self._data
+
+
+def _fake_http(monkeypatch, data, posts):
+    class _AsyncClient:
+        def __init__(self, timeout) -> None:
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc) -> None:
+            pass
+
+        async def post(self, url, headers, json):
+            posts.append((url, json))
+            return _Response(data)
+
+    monkeypatch.setattr(notebooklm_enterprise_client.httpx, "AsyncClient", _AsyncClient)
+
+
+def test_add_sources_batch_is_defined_once() -> None:
+    source = inspect.getsource(notebooklm_enterprise_client)
+
+    assert source.count("async def add_sources_batch(") == 1
+
+
+def test_add_sources_batch_maps_results_to_input_order(monkeypatch) -> None:
+    posts = []
+    _fake_http(monkeypatch, {"sourceIds": [{"id": "s1"}]}, posts)
+    client = NotebookLMEnterpriseClient(project_number="p1")
+    monkeypatch.setattr(client, "_get_headers", lambda: {})
+    contents = [
+        {"textContent": {"sourceName": "a", "content": "x"}},
+        {"webContent": {"url": "https://example.com", "sourceName": "b"}},
+    ]
+
+    results = asyncio.run(client.add_sources_batch("nb1", contents))
+
+    assert len(posts) == 1
+    assert posts[0][0].endswith("/notebooks/nb1/sources:batchCreate")
+    assert posts[0][1] == {"userContents": contents}
+    assert [(r.source_id, r.name) for r in results] == [("s1", "a"), ("", "b")]
+
+
+def test_access_token_is_refreshed_only_when_invalid() -> None:
+    class _Credentials:
+        token = "tok"
+        valid = True
+        refreshes = 0
+
+        def refresh(self, request) -> None:
+            self.refreshes += 1
+
+    client = NotebookLMEnterpriseClient(project_number="p1")
+    client._credentials = _Credentials()
+
+    assert client._get_access_token() == "tok"
+    assert client._credentials.refreshes == 0
+    client._credentials.valid = False
+    client._get_access_token()
+    assert client._credentials.refreshes == 1
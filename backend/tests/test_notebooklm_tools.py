@@ -0,0 +1,276 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.agents import notebooklm_tools
+
+
+class _Emitter:
+    def __init__(self) -> None:
+        self.events = []
+
+    def emit(self, event_type, payload) -> None:
+        self.events.append((event_type, payload))
+
+
+class _OverviewClient:
+    def __init__(self, statuses) -> None:
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    async def get_audio_overview(self, notebook_id, audio_overview_id):
+        self.calls += 1
+        return SimpleNamespace(audio_overview_id=audio_overview_id, status=self.statuses.pop(0))
+
+
+def test_poll_audio_overview_backs_off_until_ready(monkeypatch) -> None:
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(notebooklm_tools.asyncio, "sleep", fake_sleep)
+    client = _OverviewClient(["RUNNING", "RUNNING", "READY"])
+    emitter = _Emitter()
+    start = SimpleNamespace(audio_overview_id="ov1", status="CREATING")
+
+    result = asyncio.run(notebooklm_tools._poll_audio_overview(client, "nb1", start, emitter))
+
+    assert result.status == "READY"
+    assert client.calls == 3
+    assert 0.45 <= delays[0] <= 0.55
+    assert delays[0] < delays[1] < delays[2] <= 5.5
+    assert [payload["status"] for _, payload in emitter.events] == ["RUNNING", "RUNNING", "READY"]
+
+
+def test_poll_audio_overview_returns_ready_overview_without_polling() -> None:
+    client = _OverviewClient([])
+    ready = SimpleNamespace(audio_overview_id="ov1", status="DONE")
+
+    result = asyncio.run(notebooklm_tools._poll_audio_overview(client, "nb1", ready, _Emitter()))
+
+    assert result is ready
+    assert client.calls == 0
+
+
+def test_process_sources_uses_one_batch_request_when_available() -> None:
+    class _BatchClient:
+        def __init__(self) -> None:
+            self.batches = []
+
+        async def add_sources_batch(self, notebook_id, user_contents):
+            self.batches.append(user_contents)
+            return [SimpleNamespace(source_id=f"src_{i}") for i in range(len(user_contents))]
+
+    client = _BatchClient()
+    sources = [
+        {"type": "text", "name": "a", "content": "x"},
+        {"type": "audio", "name": "skipped"},
+        {"type": "drive", "name": "b", "document_id": "doc1"},
+    ]
+
+    added = asyncio.run(notebooklm_tools._process_sources(client, "nb1", sources))
+
+    assert len(client.batches) == 1
+    assert client.batches[0][0] == {"textContent": {"sourceName": "a", "content": "x"}}
+    assert client.batches[0][1]["googleDriveContent"]["documentId"] == "doc1"
+    assert [(item["source_id"], item["type"]) for item in added] == [("src_0", "text"), ("src_1", "drive")]
+
+
+def test_process_sources_splits_large_lists_into_batches(monkeypatch) -> None:
+    batches = []
+
+    class _BatchClient:
+        async def add_sources_batch(self, notebook_id, user_contents):
+            batches.append(len(user_contents))
+            offset = sum(batches[:-1])
+            return [SimpleNamespace(source_id=f"src_{offset + i}") for i in range(len(user_contents))]
+
+    monkeypatch.setattr(notebooklm_tools, "SOURCE_BATCH_MAX", 2)
+    sources = [{"type": "text", "name": str(i), "content": "x"} for i in range(5)]
+
+    added = asyncio.run(notebooklm_tools._process_sources(_BatchClient(), "nb1", sources))
+
+    assert batches == [2, 2, 1]
+    assert [item["source_id"] for item in added] == [f"src_{i}" for i in range(5)]
+
+
+def test_process_sources_rejects_short_batch_result() -> None:
+    class _ShortBatchClient:
+        async def add_sources_batch(self, notebook_id, user_contents):
+            return [SimpleNamespace(source_id="src_0")]
+
+    sources = [
+        {"type": "text", "name": "a", "content": "x"},
+        {"type": "text", "name": "b", "content": "y"},
+    ]
+
+    with pytest.raises(RuntimeError, match="Expected 2 added sources, got 1"):
+        asyncio.run(notebooklm_tools._process_sources(_ShortBatchClient(), "nb1", sources))
+
+
+def test_notebook_list_is_cached_shared_and_invalidated() -> None:
+    class _ListClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def list_notebooks(self, page_size):
+            self.calls += 1
+            await asyncio.sleep(0)
+            return [SimpleNamespace(notebook_id="nb1", title="t", user_role="OWNER", is_shared=False)]
+
+    client = _ListClient()
+    notebooklm_tools.invalidate_notebook_list()
+
+    async def run():
+        first, second = await asyncio.gather(
+            notebooklm_tools._get_notebook_list(client, 10),
+            notebooklm_tools._get_notebook_list(client, 10),
+        )
+        cached = await notebooklm_tools._get_notebook_list(client, 10)
+        notebooklm_tools.invalidate_notebook_list()
+        refreshed = await notebooklm_tools._get_notebook_list(client, 10)
+        return first, second, cached, refreshed
+
+    first, second, cached, refreshed = asyncio.run(run())
+
+    assert first == second == cached == refreshed
+    assert first[0]["notebook_id"] == "nb1"
+    assert first[0] is not cached[0]
+    assert client.calls == 2
+    notebooklm_tools.invalidate_notebook_list()
+
+
+def test_concurrent_polls_for_same_overview_share_one_loop(monkeypatch) -> None:
+    original_sleep = asyncio.sleep
+
+    async def yielding_sleep(delay):
+        await original_sleep(0)
+
+    monkeypatch.setattr(notebooklm_tools.asyncio, "sleep", yielding_sleep)
+    client = _OverviewClient(["RUNNING", "READY"])
+    first_emitter, second_emitter = _Emitter(), _Emitter()
+    start = SimpleNamespace(audio_overview_id="ov1", status="CREATING")
+
+    async def run():
+        return await asyncio.gather(
+            notebooklm_tools._poll_audio_overview(client, "nb1", start, first_emitter),
+            notebooklm_tools._poll_audio_overview(client, "nb1", start, second_emitter),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert first.status == "READY"
+    assert client.calls == 2
+    assert len(first_emitter.events) == len(second_emitter.events) == 2
+    assert notebooklm_tools._inflight_polls == {}
+
+
+def test_poll_is_cancelled_when_last_subscriber_leaves(monkeypatch) -> None:
+    original_sleep = asyncio.sleep
+
+    async def yielding_sleep(delay):
+        await original_sleep(0)
+
+    monkeypatch.setattr(notebooklm_tools.asyncio, "sleep", yielding_sleep)
+    client = _OverviewClient(["RUNNING"] * 1000)
+    start = SimpleNamespace(audio_overview_id="ov1", status="CREATING")
+
+    async def run():
+        waiter = asyncio.ensure_future(
+            notebooklm_tools._poll_audio_overview(client, "nb1", start, _Emitter())
+        )
+        other = asyncio.ensure_future(
+            notebooklm_tools._poll_audio_overview(client, "nb2", start, _Emitter())
+        )
+        for _ in range(3):
+            await original_sleep(0)
+        # 같은 overview id라도 노트북이 다르면 별도 루프
+        assert set(notebooklm_tools._inflight_polls) == {("nb1", "ov1"), ("nb2", "ov1")}
+        poll_task = notebooklm_tools._inflight_polls[("nb1", "ov1")][0]
+
+        waiter.cancel()
+        other.cancel()
+        await asyncio.gather(waiter, other, return_exceptions=True)
+        await original_sleep(0)
+        return poll_task
+
+    poll_task = asyncio.run(run())
+
+    assert poll_task.cancelled()
+    assert notebooklm_tools._inflight_polls == {}
+
+
+def test_notebook_list_cache_is_scoped_per_project() -> None:
+    class _ProjectClient:
+        def __init__(self, project_number) -> None:
+            self.project_number = project_number
+            self.location = "global"
+            self.calls = 0
+
+        async def list_notebooks(self, page_size):
+            self.calls += 1
+            return [SimpleNamespace(
+                notebook_id=f"nb-{self.project_number}", title="t", user_role="OWNER", is_shared=False,
+            )]
+
+    first_project, second_project = _ProjectClient("111"), _ProjectClient("222")
+    notebooklm_tools.invalidate_notebook_list()
+
+    async def run():
+        first = await notebooklm_tools._get_notebook_list(first_project, 10)
+        second = await notebooklm_tools._get_notebook_list(second_project, 10)
+        again = await notebooklm_tools._get_notebook_list(first_project, 10)
+        return first, second, again
+
+    first, second, again = asyncio.run(run())
+
+    assert first[0]["notebook_id"] == again[0]["notebook_id"] == "nb-111"
+    assert second[0]["notebook_id"] == "nb-222"
+    assert first_project.calls == second_project.calls == 1
+    notebooklm_tools.invalidate_notebook_list()
+
+
+def test_notebook_created_during_inflight_list_is_not_missed() -> None:
+    class _SlowListClient:
+        def __init__(self) -> None:
+            self.notebooks = ["old"]
+            self.calls = 0
+            self.started = None
+            self.release = None
+
+        async def list_notebooks(self, page_size):
+            self.calls += 1
+            snapshot = list(self.notebooks)
+            if self.calls == 1:
+                self.started.set()
+                await self.release.wait()
+            return [
+                SimpleNamespace(notebook_id=nb, title=nb, user_role="OWNER", is_shared=False)
+                for nb in snapshot
+            ]
+
+    client = _SlowListClient()
+    notebooklm_tools.invalidate_notebook_list()
+
+    async def run():
+        client.started, client.release = asyncio.Event(), asyncio.Event()
+        # 세션 A가 목록 조회를 시작한 사이 세션 B가 노트북을 만들고 다시 조회
+        session_a = asyncio.ensure_future(notebooklm_tools._get_notebook_list(client, 10))
+        await client.started.wait()
+        client.notebooks.append("new")
+        notebooklm_tools.invalidate_notebook_list()
+        session_b = asyncio.ensure_future(notebooklm_tools._get_notebook_list(client, 10))
+        await asyncio.sleep(0)
+        client.release.set()
+        return await session_a, await session_b
+
+    stale, fresh = asyncio.run(run())
+
+    assert [nb["notebook_id"] for nb in stale] == ["old"]
+    assert [nb["notebook_id"] for nb in fresh] == ["old", "new"]
+    assert client.calls == 2
+    assert notebooklm_tools._notebook_list_inflight == {}
+    notebooklm_tools.invalidate_notebook_list()
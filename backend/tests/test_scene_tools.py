@@ -0,0 +1,52 @@
+import asyncio
+
+from app.agents import scene_tools
+from app.agents.agent_types import AgentState, ToolCall, ToolContext
+
+
+def _call(context, handler, name, **arguments):
+    return asyncio.run(handler(context, ToolCall(id=f"call_{name}", name=name, arguments=arguments)))
+
+
+def test_split_scene_stamps_all_parts_once() -> None:
+    context = ToolContext(state=AgentState(session_id="s"))
+    _call(context, scene_tools._create_scene, "create_scene", scene_id="s1", title="Opening", summary="intro")
+
+    result = _call(
+        context,
+        scene_tools._split_scene,
+        "split_scene",
+        scene_id="s1",
+        parts=[{"summary": "a"}, {"summary": ""}, {"title": "Custom", "summary": "b"}],
+    )
+
+    created = result.output["created"]
+    assert [scene["title"] for scene in created] == ["Opening Part 1", "Custom"]
+    assert created[0]["created_at"] == created[1]["created_at"]
+    assert created[0]["created_at"].endswith("Z")
+    assert all(scene["split_from"] == "s1" for scene in created)
+
+
+def test_merge_dict_merges_one_level_without_mutating_inputs() -> None:
+    base = {"style": {"tone": "dark", "lens": "35mm"}, "title": "A"}
+    patch = {"style": {"tone": "warm"}, "title": "B", "extra": {"k": 1}}
+
+    merged = scene_tools._merge_dict(base, patch)
+
+    assert merged == {"style": {"tone": "warm", "lens": "35mm"}, "title": "B", "extra": {"k": 1}}
+    assert base["style"] == {"tone": "dark", "lens": "35mm"}
+    assert merged["style"] is not base["style"]
+
+
+def test_merge_scenes_joins_non_empty_summaries() -> None:
+    context = ToolContext(state=AgentState(session_id="s"))
+    store = scene_tools._scene_store(context)
+    store["a"] = {"scene_id": "a", "summary": "first", "style": {"tone": "dark"}}
+    store["b"] = {"scene_id": "b", "summary": ""}
+    store["c"] = {"scene_id": "c", "summary": "third"}
+
+    result = _call(context, scene_tools._merge_scenes, "merge_scenes", scene_ids=["a", "b", "missing", "c"])
+
+    assert result.output["summary"] == "first third"
+    assert result.output["style"] == {"tone": "dark"}
+    assert result.output["merged_from"] == ["a", "b", "missing", "c"]
@@ -0,0 +1,14 @@
+from app.agents import tool_utils
+
+
+def test_enterprise_client_cache_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(tool_utils, "ENTERPRISE_CLIENT_CACHE_MAX_ENTRIES", 2)
+    tool_utils.clear_client_cache()
+
+    first = tool_utils.get_enterprise_client("p1")
+    assert tool_utils.get_enterprise_client("p1") is first
+    tool_utils.get_enterprise_client("p2")
+    tool_utils.get_enterprise_client("p3")
+
+    assert tool_utils.get_enterprise_client("p1") is not first
+    tool_utils.clear_client_cache()
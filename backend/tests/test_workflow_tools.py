@@ -0,0 +1,46 @@
+import asyncio
+
+from app.agents import director
+from app.agents.agent_types import AgentState, ToolCall, ToolContext, ToolTaskState
+from app.agents.workflow_tools import _compile_workflow_handler
+
+
+def test_compile_workflow_serializes_plan(monkeypatch) -> None:
+    async def fake_interpret(self, description, output_type):
+        return director.NarrativeDNA(core_theme="theme", overall_tone="tone", visual_style="style")
+
+    monkeypatch.setattr(director.DirectorAgent, "_interpret_custom_vibe", fake_interpret)
+    call = ToolCall(id="call_1", name="compile_workflow", arguments={"vibe_description": "dark noir"})
+    result = asyncio.run(_compile_workflow_handler(ToolContext(state=AgentState(session_id="s")), call))
+
+    assert result.status == ToolTaskState.COMPLETED
+    output = result.output
+    assert output["narrative_dna"]["core_theme"] == "theme"
+    node = output["nodes"][0]
+    assert node["category"] == "input"
+    assert node["position"] == {"x": 100.0, "y": 200.0}
+    assert "input_handles" not in node
+    assert output["edges"][0]["source"] == "source_1"
+
+
+def test_compile_workflow_reuses_custom_vibe_across_calls(monkeypatch) -> None:
+    prompts = []
+
+    class FakeResponse:
+        text = '{"core_theme": "theme", "overall_tone": "tone", "visual_style": "style"}'
+
+    class FakeModel:
+        async def generate_content_async(self, prompt):
+            prompts.append(prompt)
+            return FakeResponse()
+
+    monkeypatch.setattr(director, "_get_custom_vibe_model", lambda: FakeModel())
+    monkeypatch.setattr(director, "_custom_vibe_cache", director._TTLCache(60, 8))
+    context = ToolContext(state=AgentState(session_id="s"))
+
+    for call_id in ("call_1", "call_2"):
+        call = ToolCall(id=call_id, name="compile_workflow", arguments={"vibe_description": "dark noir"})
+        result = asyncio.run(_compile_workflow_handler(context, call))
+        assert result.status == ToolTaskState.COMPLETED
+
+    assert len(prompts) == 1